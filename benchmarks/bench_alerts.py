@@ -0,0 +1,77 @@
+"""Time alert rule evaluation across a large watchlist.
+
+Usage::
+
+    python benchmarks/bench_alerts.py [--rules 5000] [--tickers 1000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from stock_research.alerts.rules import AlertRule, CompiledRules  # noqa: E402
+
+FIELDS = ["RSI", "Stoch_K", "ADX", "Close", "SMA50", "SMA200", "MACD", "Signal_Line"]
+SIGNALS = {"Price vs SMA200": ["Bullish", "Bearish"], "RSI": ["Overbought", "Oversold", "Neutral"]}
+
+
+def random_rules(count: int, tickers: list, rng: np.random.Generator) -> list:
+    """Mix of threshold, pair, crossing and signal rules."""
+    rules = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            field = FIELDS[rng.integers(len(FIELDS))]
+            op = [">", "<", ">=", "<="][rng.integers(4)]
+            condition = f"{field} {op} {rng.uniform(0, 100):.1f}"
+        elif kind == 1:
+            lhs, rhs = rng.choice(FIELDS, 2, replace=False)
+            condition = f"{lhs} {['>', '<'][rng.integers(2)]} {rhs}"
+        elif kind == 2:
+            condition = f"RSI {['crosses_above', 'crosses_below'][rng.integers(2)]} {rng.uniform(20, 80):.1f}"
+        else:
+            name = list(SIGNALS)[rng.integers(len(SIGNALS))]
+            condition = f"{name} == {rng.choice(SIGNALS[name])}"
+        scope = list(rng.choice(tickers, 5, replace=False)) if i % 3 == 0 else None
+        rules.append(AlertRule(name=f"rule-{i}", condition=condition, tickers=scope))
+    return rules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=5000)
+    parser.add_argument("--tickers", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+    rules = random_rules(args.rules, tickers, rng)
+
+    start = time.perf_counter()
+    compiled = CompiledRules(rules, tickers)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    rows = np.arange(args.tickers)
+    current = rng.uniform(0, 100, (args.tickers, len(compiled.fields)))
+    previous = rng.uniform(0, 100, (args.tickers, len(compiled.fields)))
+    signals = np.empty((args.tickers, len(compiled.signal_names)), dtype=object)
+    for j, name in enumerate(compiled.signal_names):
+        signals[:, j] = rng.choice(SIGNALS[name], args.tickers)
+
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        hits = compiled.evaluate(rows, current, previous, signals)
+        best = min(best, time.perf_counter() - start)
+
+    print(f"Compiled {args.rules} rules in {compile_ms:.1f} ms")
+    print(f"Evaluated {args.rules} rules x {args.tickers} tickers in {best * 1000:.1f} ms "
+          f"({int(hits.sum())} hits)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Check the NumPy indicator kernels against pandas references and time them.
+
+The references live in ``tests/test_indicators.py``, which pytest runs on a
+small panel.
+
+Usage::
+
+    python benchmarks/bench_indicators.py [--bars 2520] [--tickers 500]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests"))
+
+from test_indicators import check, kernels, random_ohlcv, reference  # noqa: E402
+
+
+def timed(func, repeat: int = 5) -> float:
+    """Best wall time of ``func`` over ``repeat`` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bars", type=int, default=2520)
+    parser.add_argument("--tickers", type=int, default=500)
+    args = parser.parse_args()
+
+    panel = random_ohlcv(args.bars, args.tickers)
+    print(f"Max abs difference vs pandas: {check(panel):.2e}")
+
+    single = {name: values[:, 0] for name, values in panel.items()}
+    single_df = pd.DataFrame(single).dropna()
+    h, l, c, v = (single_df[name].to_numpy() for name in ("High", "Low", "Close", "Volume"))
+    print(f"Single series ({len(single_df)} bars):")
+    print(f"  numpy kernels      {timed(lambda: kernels(h, l, c, v)):9.2f} ms")
+    print(f"  pandas reference   {timed(lambda: reference(single_df)):9.2f} ms")
+
+    print(f"Panel ({args.bars} bars x {args.tickers} tickers):")
+    numpy_ms = timed(lambda: kernels(panel["High"], panel["Low"], panel["Close"], panel["Volume"]), 3)
+    frames = [pd.DataFrame({name: values[:, i] for name, values in panel.items()}).dropna()
+              for i in range(args.tickers)]
+    pandas_ms = timed(lambda: [reference(df) for df in frames], 1)
+    print(f"  numpy kernels      {numpy_ms:9.2f} ms")
+    print(f"  pandas per-ticker  {pandas_ms:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Check the rolling risk kernels against pandas references and time them.
+
+Exits with status 1 if any metric differs from the reference.
+
+Usage::
+
+    python benchmarks/bench_risk.py [--bars 1260] [--tickers 200] [--window 63]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from stock_research.analysis.risk import compute_risk  # noqa: E402
+
+LEVEL = 0.95
+TOLERANCE = 1e-8
+METRICS = ["Beta", "Volatility", "VaR (Historical)", "CVaR (Historical)", "Drawdown", "Max Drawdown"]
+
+
+def reference(closes: pd.DataFrame, benchmark: pd.Series, window: int) -> dict:
+    """Straightforward pandas implementations of the non-parametric metrics.
+
+    Each ticker is computed on its own trading days against the benchmark
+    forward-filled onto those days.
+    """
+    tail = int(np.ceil((1 - LEVEL) * window))
+    filled = benchmark.reindex(closes.index.union(benchmark.index)).ffill()
+    columns = {name: {} for name in METRICS}
+    for ticker in closes.columns:
+        prices = closes[ticker].dropna()
+        rets = prices.pct_change(fill_method=None)
+        bench = filled.reindex(prices.index).pct_change(fill_method=None)
+        rolling = rets.rolling(window)
+        metrics = {
+            "Beta": rolling.cov(bench) / bench.where(rets.notna()).rolling(window).var(),
+            "Volatility": rolling.std() * np.sqrt(252),
+            "VaR (Historical)": -rolling.apply(lambda a: np.sort(a)[tail - 1], raw=True),
+            "CVaR (Historical)": -rolling.apply(lambda a: np.sort(a)[:tail].mean(), raw=True),
+            "Drawdown": prices / prices.cummax() - 1,
+            "Max Drawdown": prices.rolling(window + 1).apply(
+                lambda a: (a / np.maximum.accumulate(a) - 1).min(), raw=True
+            ),
+        }
+        for name, values in metrics.items():
+            columns[name][ticker] = values
+    return {name: pd.DataFrame(columns[name]).reindex(closes.index) for name in METRICS}
+
+
+def random_prices(bars: int, tickers: int, seed: int = 0) -> tuple:
+    """Random-walk closes and benchmark with staggered listing dates and differing holidays."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2020-01-01", periods=bars)
+    market = rng.normal(0, 0.01, bars)
+    betas = rng.uniform(0.5, 1.5, tickers)
+    rets = market[:, None] * betas + rng.normal(0, 0.015, (bars, tickers))
+    closes = pd.DataFrame(100 * np.exp(np.cumsum(rets, axis=0)), index=index,
+                          columns=[f"T{i:04d}" for i in range(tickers)])
+    for i, start in enumerate(rng.integers(0, bars // 2, tickers // 4)):
+        closes.iloc[:start, i] = np.nan
+    # Half the tickers trade on another exchange calendar with its own holidays
+    holidays = rng.random((bars, tickers)) < 0.03
+    holidays[:, ::2] = False
+    closes = closes.mask(holidays)
+    benchmark = pd.Series(100 * np.exp(np.cumsum(market)), index=index)
+    return closes, benchmark[rng.random(bars) >= 0.02]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bars", type=int, default=1260)
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--window", type=int, default=63)
+    args = parser.parse_args()
+
+    closes, benchmark = random_prices(args.bars, args.tickers)
+
+    start = time.perf_counter()
+    risk = compute_risk(closes, benchmark, args.window, LEVEL)
+    kernel_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = reference(closes, benchmark, args.window)
+    reference_time = time.perf_counter() - start
+
+    print(f"{args.tickers} tickers x {args.bars} bars, {args.window}-bar window")
+    mismatched = []
+    for name, frame in expected.items():
+        got, want = risk[name].to_numpy(), frame.to_numpy()
+        same_nans = bool((np.isnan(got) == np.isnan(want)).all())
+        diff = np.nanmax(np.abs(got - want))
+        print(f"  {name:<18} max abs diff {diff:.2e}  NaNs match: {same_nans}")
+        if not same_nans or not diff <= TOLERANCE:
+            mismatched.append(name)
+    print(f"NumPy kernels (all metrics): {kernel_time * 1000:8.1f} ms")
+    print(f"pandas reference (subset):   {reference_time * 1000:8.1f} ms ({reference_time / kernel_time:.0f}x)")
+    if mismatched:
+        sys.exit(f"Mismatch against the pandas reference: {', '.join(mismatched)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import logging
 from typing import Any, Dict, Optional
 from datetime import datetime
 
@@ -5,6 +6,9 @@ from phidata import Agent, Knowledge
 from pydantic import BaseModel
 
 from ...config.settings import settings
+from .features import FeatureContext, build_feature_context
+
+logger = logging.getLogger(__name__)
 
 class AnalysisResult(BaseModel):
     """Base model for analysis results."""
@@ -42,12 +46,27 @@ class BaseAnalysisAgent(Agent):
         """Format the analysis prompt."""
         raise NotImplementedError
     
+    def build_context(self, ticker: str) -> FeatureContext:
+        """Build the precomputed market data context shared by all agents."""
+        return build_feature_context(ticker)
+    
     def analyze(self, ticker: str) -> AnalysisResult:
         """Perform analysis for the given ticker."""
-        prompt = self.format_prompt(ticker)
+        context = self.build_context(ticker)
+        logger.info(
+            "%s context for %s: %d tokens in %.1f ms (sections=%s, failed=%s, truncated=%s)",
+            self.name, ticker, context.token_count, context.build_ms,
+            ",".join(context.sections), ",".join(context.failed), context.truncated,
+        )
+        
+        prompt = f"{context.text}\n\n{self.format_prompt(ticker)}"
         response = self.run(prompt)
         
-        return self.process_response(ticker, response)
+        result = self.process_response(ticker, response)
+        result.data["context_tokens"] = context.token_count
+        result.data["context_build_ms"] = context.build_ms
+        result.data["context_failed"] = context.failed
+        return result
     
     def process_response(self, ticker: str, response: str) -> AnalysisResult:
         """Process the agent's response into a structured format."""
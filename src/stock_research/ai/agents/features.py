@@ -0,0 +1,209 @@
+"""Compact, token-budgeted market data context for agent prompts.
+
+Rather than pasting raw ``.info`` dicts or price tables into prompts, this
+summarizes the already computed indicators, signals, fundamentals and news
+sentiment into short ``key: value`` lines. Sections are filled in priority
+order until the token budget is spent. A section whose builder fails is
+logged and listed in ``FeatureContext.failed`` rather than silently omitted.
+"""
+import logging
+import math
+import time
+from typing import List, Optional, Sequence
+
+import numpy as np
+from pydantic import BaseModel
+
+from ...analysis.sentiment import summarize_news
+from ...config.settings import settings
+from ...data import loaders
+from ...data.cache import cache
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = ("technical", "fundamental", "sentiment")
+
+TECHNICAL_FEATURES = ["RSI", "MACD", "ADX", "Stoch_K", "ATR", "OBV"]
+
+FUNDAMENTAL_LABELS = {
+    "trailingPE": "P/E",
+    "priceToBook": "P/B",
+    "enterpriseToEbitda": "EV/EBITDA",
+    "profitMargins": "Net margin",
+    "returnOnEquity": "ROE",
+    "revenueGrowth": "Revenue growth",
+    "debtToEquity": "Debt/Equity",
+    "currentRatio": "Current ratio",
+}
+
+try:
+    import tiktoken
+
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken is optional
+    _encoding = None
+
+
+class FeatureContext(BaseModel):
+    """Prompt context block with its build measurements."""
+
+    ticker: str
+    text: str
+    token_count: int
+    build_ms: float
+    sections: List[str]
+    failed: List[str] = []
+    truncated: bool
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken when installed, else estimate at ~4 chars per token."""
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return math.ceil(len(text) / 4)
+
+
+def _percentile(value: float, history: np.ndarray) -> Optional[int]:
+    """Percentile rank of ``value`` within ``history``, ignoring NaNs."""
+    history = history[~np.isnan(history)]
+    if len(history) < 3 or value is None or np.isnan(value):
+        return None
+    return int(round(100 * np.mean(history <= value)))
+
+
+def _fmt(value: float) -> str:
+    """Format a number compactly."""
+    if abs(value) >= 1e6:
+        return f"{value:.3g}"
+    return f"{value:.2f}"
+
+
+def technical_lines(ticker: str) -> List[str]:
+    """Latest indicators with their percentile over the loaded history, then the signals."""
+    df, signals = loaders.load_technical(ticker)
+    if len(df) == 0:
+        return []
+
+    close = df["Close"].iloc[-1]
+    change = (close / df["Close"].iloc[0] - 1) * 100
+    lines = [f"Close: {_fmt(close)} ({change:+.1f}% over {len(df)} bars)"]
+    for column in TECHNICAL_FEATURES:
+        if column not in df:
+            continue
+        value = df[column].iloc[-1]
+        if np.isnan(value):
+            continue
+        pct = _percentile(value, df[column].to_numpy())
+        lines.append(f"{column}: {_fmt(value)}" + (f" (p{pct})" if pct is not None else ""))
+
+    for category, category_signals in (signals or {}).items():
+        lines.append(
+            f"{category}: " + ", ".join(f"{name}={value}" for name, value in category_signals.items())
+        )
+    return lines
+
+
+def _peer_values(field: str) -> np.ndarray:
+    """Cached values of an ``.info`` field across the watchlist, without fetching."""
+    values = []
+    for peer in settings.WATCHLIST:
+        info = cache.get("info", peer)
+        if info and isinstance(info.get(field), (int, float)):
+            values.append(float(info[field]))
+    return np.array(values, dtype=float)
+
+
+def fundamental_lines(ticker: str) -> List[str]:
+    """Key ratios with their percentile among cached watchlist peers."""
+    metrics = loaders.get_fundamentals(ticker)
+    lines = []
+    for field, label in FUNDAMENTAL_LABELS.items():
+        value = metrics.get(field)
+        if not isinstance(value, (int, float)):
+            continue
+        pct = _percentile(float(value), _peer_values(field))
+        lines.append(f"{label}: {_fmt(value)}" + (f" (peer p{pct})" if pct is not None else ""))
+    return lines
+
+
+def sentiment_lines(ticker: str, headlines: int = 3) -> List[str]:
+    """News sentiment counts, average score and the latest headlines."""
+    _, scored = loaders.load_scored_news(ticker)
+    if not scored:
+        return []
+
+    summary = summarize_news(scored)
+    average = sum(item["sentiment_score"] for item in scored) / len(scored)
+    lines = [
+        f"News: {summary['total']} items, {summary['positive']} positive, "
+        f"{summary['negative']} negative, {summary['neutral']} neutral, avg score {average:+.2f}"
+    ]
+    latest = sorted(scored, key=lambda item: item["date"], reverse=True)[:headlines]
+    for item in latest:
+        lines.append(f"- [{item['sentiment_category']}] {item['title'][:120]}")
+    return lines
+
+
+_BUILDERS = {
+    "technical": technical_lines,
+    "fundamental": fundamental_lines,
+    "sentiment": sentiment_lines,
+}
+
+
+def build_feature_context(
+    ticker: str,
+    sections: Sequence[str] = SECTIONS,
+    token_budget: Optional[int] = None,
+) -> FeatureContext:
+    """Build the context block for ``ticker`` within ``token_budget`` tokens."""
+    start = time.perf_counter()
+    budget = settings.CONTEXT_TOKEN_BUDGET if token_budget is None else token_budget
+
+    header = f"Market data for {ticker} (pN = percentile rank):"
+    blocks: List[str] = [header]
+    used = count_tokens(header)
+    included: List[str] = []
+    failed: List[str] = []
+    truncated = False
+
+    for name in sections:
+        try:
+            lines = _BUILDERS[name](ticker)
+        except Exception:
+            logger.warning("Skipping %s context for %s", name, ticker, exc_info=True)
+            failed.append(name)
+            continue
+        if not lines:
+            continue
+
+        title = f"[{name}]"
+        cost = count_tokens(title) + 1
+        if used + cost >= budget:
+            truncated = True
+            break
+        block = [title]
+        used += cost
+        for line in lines:
+            line_cost = count_tokens(line) + 1
+            if used + line_cost > budget:
+                truncated = True
+                break
+            block.append(line)
+            used += line_cost
+        if len(block) > 1:
+            blocks.append("\n".join(block))
+            included.append(name)
+        if truncated:
+            break
+
+    text = "\n".join(blocks)
+    return FeatureContext(
+        ticker=ticker,
+        text=text,
+        token_count=count_tokens(text),
+        build_ms=(time.perf_counter() - start) * 1000,
+        sections=included,
+        failed=failed,
+        truncated=truncated,
+    )
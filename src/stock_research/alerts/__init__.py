@@ -0,0 +1 @@
+"""Rule-based alerts over technical indicators and signals."""
@@ -0,0 +1,8 @@
+"""Run the alert engine over the watchlist."""
+import logging
+
+from stock_research.alerts.engine import run_forever
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_forever()
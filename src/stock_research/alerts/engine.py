@@ -0,0 +1,130 @@
+"""Incremental alert evaluation over a watchlist.
+
+Run as ``python -m stock_research.alerts``. Each cycle loads the cached
+indicator frames for the watchlist, and only tickers whose last two bars or
+signals changed since the previous cycle are evaluated. Level rules (``>``,
+``==`` ...) fire when their condition becomes true, not on every bar it stays
+true.
+"""
+import hashlib
+import logging
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from stock_research.alerts.rules import Alert, AlertRule, CompiledRules, load_rules
+from stock_research.alerts.sinks import FileSink, WebhookSink
+from stock_research.config.settings import settings
+from stock_research.data import loaders
+from stock_research.data.ratelimit import BATCH
+
+logger = logging.getLogger(__name__)
+
+
+class Snapshot(NamedTuple):
+    """Inputs of one ticker for the latest bar."""
+
+    bar: str
+    current: np.ndarray
+    previous: np.ndarray
+    signals: np.ndarray
+    version: str
+
+
+class AlertEngine:
+    """Evaluates compiled rules for tickers whose inputs changed."""
+
+    def __init__(self, rules: List[AlertRule], tickers: Sequence[str], sinks: Sequence = ()):
+        self.compiled = CompiledRules(rules, list(tickers))
+        self.sinks = list(sinks)
+        self._ticker_index = {ticker: i for i, ticker in enumerate(self.compiled.tickers)}
+        self._versions: Dict[str, str] = {}
+        self._active = np.zeros((len(self.compiled.tickers), len(rules)), dtype=bool)
+
+    def snapshot(self, df: pd.DataFrame, signals: Optional[dict]) -> Snapshot:
+        """Extract the fields the rules need from an indicator frame and its signals."""
+        values = df.reindex(columns=self.compiled.fields).to_numpy(dtype=float)[-2:]
+        if len(values) < 2:
+            values = np.vstack([np.full(len(self.compiled.fields), np.nan), values])
+
+        flat_signals = {
+            name: value
+            for category_signals in (signals or {}).values()
+            for name, value in category_signals.items()
+        }
+        labels = np.array([flat_signals.get(name) for name in self.compiled.signal_names], dtype=object)
+
+        digest = hashlib.sha1(values.tobytes())
+        digest.update(repr(labels.tolist()).encode("utf-8"))
+        return Snapshot(str(df.index[-1]), values[1], values[0], labels, digest.hexdigest())
+
+    def evaluate(self, snapshots: Dict[str, Snapshot]) -> List[Alert]:
+        """Evaluate changed tickers, deliver new alerts to the sinks and return them."""
+        changed = [
+            ticker for ticker, snap in snapshots.items()
+            if ticker in self._ticker_index and self._versions.get(ticker) != snap.version
+        ]
+        if not changed:
+            return []
+
+        rows = np.array([self._ticker_index[ticker] for ticker in changed])
+        current = np.array([snapshots[ticker].current for ticker in changed]).reshape(len(changed), -1)
+        previous = np.array([snapshots[ticker].previous for ticker in changed]).reshape(len(changed), -1)
+        signals = np.empty((len(changed), len(self.compiled.signal_names)), dtype=object)
+        for i, ticker in enumerate(changed):
+            signals[i] = snapshots[ticker].signals
+
+        hits = self.compiled.evaluate(rows, current, previous, signals)
+        fired = hits & ~self._active[rows]
+        self._active[rows] = hits
+        for ticker in changed:
+            self._versions[ticker] = snapshots[ticker].version
+
+        alerts = []
+        for i, r in zip(*np.nonzero(fired)):
+            ticker = changed[i]
+            alerts.append(Alert(
+                rule=self.compiled.rules[r].name,
+                ticker=ticker,
+                condition=self.compiled.rules[r].condition,
+                bar=snapshots[ticker].bar,
+                values={
+                    field: None if np.isnan(value) else float(value)
+                    for field, value in zip(self.compiled.fields, current[i])
+                },
+            ))
+
+        for sink in self.sinks:
+            sink.send(alerts)
+        return alerts
+
+
+def run_forever(watchlist: Optional[List[str]] = None) -> None:
+    """Evaluate the configured rules over the watchlist every ``ALERT_INTERVAL`` seconds."""
+    tickers = [ticker.upper() for ticker in (watchlist or settings.WATCHLIST)]
+    engine = AlertEngine(
+        load_rules(settings.ALERT_RULES_FILE),
+        tickers,
+        sinks=[FileSink(), WebhookSink()],
+    )
+
+    while True:
+        start = time.monotonic()
+        snapshots = {}
+        for ticker in tickers:
+            try:
+                df, signals = loaders.load_technical(ticker, priority=BATCH)
+            except Exception as e:
+                logger.warning("Failed to load %s: %s", ticker, e)
+                continue
+            if len(df) > 0:
+                snapshots[ticker] = engine.snapshot(df, signals)
+
+        alerts = engine.evaluate(snapshots)
+        logger.info(
+            "Evaluated %d rules over %d tickers: %d alerts in %.2fs",
+            len(engine.compiled.rules), len(snapshots), len(alerts), time.monotonic() - start,
+        )
+        time.sleep(max(0.0, settings.ALERT_INTERVAL - (time.monotonic() - start)))
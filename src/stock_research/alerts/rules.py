@@ -0,0 +1,224 @@
+"""Alert rule parsing and vectorized evaluation.
+
+A rule condition has the form ``<lhs> <op> <rhs>``:
+
+- ``RSI > 70`` compares an indicator column with a number;
+- ``Close < SMA200`` compares two indicator columns;
+- ``Close crosses_above SMA200`` / ``RSI crosses_below 30`` fire on the bar
+  where the relation flips between the previous and the current bar;
+- ``Price vs SMA200 == Bearish`` compares a signal from
+  ``get_technical_signals`` with a label (``==`` or ``!=`` with a
+  non-numeric right-hand side).
+
+Field and signal names are checked when rules are compiled, so a misspelt
+name is a ``RuleSyntaxError`` rather than a rule that never fires.
+
+Rules are compiled once into groups sharing the same left-hand side and
+operator, so evaluation is a handful of NumPy comparisons across all changed
+tickers and all rules in a group at once.
+"""
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from stock_research.analysis.technical import INDICATOR_COLUMNS, SIGNAL_NAMES
+
+_CONDITION = re.compile(
+    r"^\s*(?P<lhs>.+?)\s+(?P<op>crosses_above|crosses_below|>=|<=|==|!=|>|<)\s+(?P<rhs>.+?)\s*$"
+)
+
+COMPARISONS = {
+    ">": np.greater,
+    "<": np.less,
+    ">=": np.greater_equal,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+
+class RuleSyntaxError(ValueError):
+    """Raised when a rule condition cannot be parsed or names an unknown field or signal."""
+
+
+class AlertRule(BaseModel):
+    """User-defined alert rule."""
+
+    name: str
+    condition: str
+    tickers: Optional[List[str]] = None
+
+
+class Alert(BaseModel):
+    """Alert fired by a rule for one ticker."""
+
+    rule: str
+    ticker: str
+    condition: str
+    bar: str
+    values: Dict[str, Any]
+
+
+def load_rules(path: Path) -> List[AlertRule]:
+    """Load rules from a JSON file containing a list of rule objects."""
+    with open(path, encoding="utf-8") as f:
+        return [AlertRule(**rule) for rule in json.load(f)]
+
+
+def _parse(condition: str) -> Tuple[str, str, str]:
+    """Split a condition into ``(lhs, op, rhs)``."""
+    match = _CONDITION.match(condition)
+    if not match:
+        raise RuleSyntaxError(f"Cannot parse alert condition: {condition!r}")
+    return match.group("lhs"), match.group("op"), match.group("rhs")
+
+
+def _as_number(value: str) -> Optional[float]:
+    """Parse a numeric literal, or return None."""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _check_name(name: str, known: List[str], kind: str, condition: str) -> None:
+    """Raise ``RuleSyntaxError`` unless ``name`` is one of ``known``."""
+    if name not in known:
+        raise RuleSyntaxError(
+            f"Unknown {kind} {name!r} in alert condition {condition!r}; expected one of {', '.join(known)}"
+        )
+
+
+class CompiledRules:
+    """Rules grouped by shape for vectorized evaluation.
+
+    ``known_fields`` and ``known_signals`` default to the columns and signals
+    produced by ``stock_research.analysis.technical``.
+    """
+
+    def __init__(
+        self,
+        rules: List[AlertRule],
+        tickers: List[str],
+        known_fields: Iterable[str] = INDICATOR_COLUMNS,
+        known_signals: Iterable[str] = SIGNAL_NAMES,
+    ):
+        known_fields, known_signals = list(known_fields), list(known_signals)
+        self.rules = rules
+        self.tickers = [ticker.upper() for ticker in tickers]
+        ticker_index = {ticker: i for i, ticker in enumerate(self.tickers)}
+
+        # Each group maps a key to (rule indices, per-rule operands)
+        threshold: Dict[Tuple[str, str], Tuple[list, list]] = {}
+        pair: Dict[Tuple[str, str, str], list] = {}
+        cross_threshold: Dict[Tuple[str, str], Tuple[list, list]] = {}
+        cross_pair: Dict[Tuple[str, str, str], list] = {}
+        signal: Dict[Tuple[str, str], Tuple[list, list]] = {}
+        fields, signal_names = set(), set()
+
+        for i, rule in enumerate(rules):
+            lhs, op, rhs = _parse(rule.condition)
+            number = _as_number(rhs)
+            crossing = op.startswith("crosses")
+
+            if op in ("==", "!=") and number is None:
+                _check_name(lhs, known_signals, "signal", rule.condition)
+                signal_names.add(lhs)
+                indices, labels = signal.setdefault((lhs, op), ([], []))
+                indices.append(i)
+                labels.append(rhs)
+                continue
+
+            _check_name(lhs, known_fields, "field", rule.condition)
+            fields.add(lhs)
+            if number is not None:
+                group = cross_threshold if crossing else threshold
+                indices, values = group.setdefault((lhs, op), ([], []))
+                indices.append(i)
+                values.append(number)
+            else:
+                _check_name(rhs, known_fields, "field", rule.condition)
+                fields.add(rhs)
+                group = cross_pair if crossing else pair
+                group.setdefault((lhs, op, rhs), []).append(i)
+
+        self.fields = sorted(fields)
+        self.signal_names = sorted(signal_names)
+        self._field_index = {field: i for i, field in enumerate(self.fields)}
+        self._signal_index = {name: i for i, name in enumerate(self.signal_names)}
+
+        def arrays(groups):
+            return {
+                key: (np.array(indices), np.array(values))
+                for key, (indices, values) in groups.items()
+            }
+
+        self.threshold = arrays(threshold)
+        self.cross_threshold = arrays(cross_threshold)
+        self.signal = {
+            key: (np.array(indices), np.array(labels, dtype=object))
+            for key, (indices, labels) in signal.items()
+        }
+        self.pair = {key: np.array(indices) for key, indices in pair.items()}
+        self.cross_pair = {key: np.array(indices) for key, indices in cross_pair.items()}
+
+        # applies[r, t]: whether rule r is scoped to ticker t
+        self.applies = np.ones((len(rules), len(self.tickers)), dtype=bool)
+        for i, rule in enumerate(rules):
+            if rule.tickers is not None:
+                self.applies[i] = False
+                scoped = [ticker_index[t.upper()] for t in rule.tickers if t.upper() in ticker_index]
+                self.applies[i, scoped] = True
+
+    def evaluate(
+        self,
+        rows: np.ndarray,
+        current: np.ndarray,
+        previous: np.ndarray,
+        signals: np.ndarray,
+    ) -> np.ndarray:
+        """Evaluate all rules for a set of tickers.
+
+        ``rows`` holds ticker indices, ``current``/``previous`` are
+        ``(len(rows), len(fields))`` float arrays for the last two bars and
+        ``signals`` is a ``(len(rows), len(signal_names))`` object array.
+        Returns a ``(len(rows), len(rules))`` boolean matrix.
+        """
+        result = np.zeros((len(rows), len(self.rules)), dtype=bool)
+        col = self._field_index
+
+        with np.errstate(invalid="ignore"):
+            for (lhs, op), (indices, values) in self.threshold.items():
+                result[:, indices] = COMPARISONS[op](current[:, col[lhs], None], values)
+
+            for (lhs, op, rhs), indices in self.pair.items():
+                hit = COMPARISONS[op](current[:, col[lhs]], current[:, col[rhs]])
+                result[:, indices] = hit[:, None]
+
+            for (lhs, op), (indices, values) in self.cross_threshold.items():
+                now = current[:, col[lhs], None] - values
+                before = previous[:, col[lhs], None] - values
+                result[:, indices] = _crossed(op, now, before)
+
+            for (lhs, op, rhs), indices in self.cross_pair.items():
+                now = current[:, col[lhs]] - current[:, col[rhs]]
+                before = previous[:, col[lhs]] - previous[:, col[rhs]]
+                result[:, indices] = _crossed(op, now, before)[:, None]
+
+        for (name, op), (indices, labels) in self.signal.items():
+            values = signals[:, self._signal_index[name], None]
+            present = np.not_equal(values, None)
+            result[:, indices] = COMPARISONS[op](values, labels).astype(bool) & present
+
+        return result & self.applies[:, rows].T
+
+
+def _crossed(op: str, now: np.ndarray, before: np.ndarray) -> np.ndarray:
+    """Whether ``lhs - rhs`` changed sign in the direction of ``op``."""
+    if op == "crosses_above":
+        return (before <= 0) & (now > 0)
+    return (before >= 0) & (now < 0)
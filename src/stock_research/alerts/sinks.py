@@ -0,0 +1,49 @@
+"""Local destinations for fired alerts."""
+import json
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+import requests
+
+from stock_research.alerts.rules import Alert
+from stock_research.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class FileSink:
+    """Append alerts as JSON lines to a local file."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or settings.ALERT_LOG_FILE)
+
+    def send(self, alerts: List[Alert]) -> None:
+        """Write alerts to the file."""
+        if not alerts:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for alert in alerts:
+                f.write(alert.model_dump_json() + "\n")
+
+
+class WebhookSink:
+    """Post alerts to a webhook; only logs them when no URL is configured."""
+
+    def __init__(self, url: Optional[str] = None, timeout: float = 5.0):
+        self.url = url if url is not None else settings.ALERT_WEBHOOK_URL
+        self.timeout = timeout
+
+    def send(self, alerts: List[Alert]) -> None:
+        """Deliver alerts in a single request."""
+        if not alerts:
+            return
+        payload = {"alerts": [json.loads(alert.model_dump_json()) for alert in alerts]}
+        if not self.url:
+            logger.info("Webhook not configured, dropping %d alerts: %s", len(alerts), payload)
+            return
+        try:
+            requests.post(self.url, json=payload, timeout=self.timeout).raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("Failed to deliver %d alerts to webhook: %s", len(alerts), e)
@@ -0,0 +1 @@
+"""Vectorized analytics for stock research application."""
@@ -0,0 +1,98 @@
+"""Trailing-twelve-month ratios and growth series from quarterly statements.
+
+All periods are computed in one vectorized pass over the statement frames
+(periods as rows, line items as columns). Trailing sums are only reported
+where the four quarters are consecutive, so gaps in the stored history never
+produce a misleading TTM figure.
+"""
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Yahoo line item names, most common first
+LINE_ITEMS: Dict[str, List[str]] = {
+    "revenue": ["Total Revenue", "Operating Revenue"],
+    "gross_profit": ["Gross Profit"],
+    "operating_income": ["Operating Income", "EBIT"],
+    "net_income": ["Net Income", "Net Income Common Stockholders"],
+    "total_assets": ["Total Assets"],
+    "equity": ["Stockholders Equity", "Common Stock Equity", "Total Equity Gross Minority Interest"],
+    "total_debt": ["Total Debt"],
+    "current_assets": ["Current Assets"],
+    "current_liabilities": ["Current Liabilities"],
+    "operating_cash_flow": ["Operating Cash Flow"],
+    "capital_expenditure": ["Capital Expenditure"],
+}
+
+# Days spanned by four and five consecutive quarter ends
+_TTM_SPAN_DAYS = (250, 300)
+_YOY_SPAN_DAYS = (340, 390)
+
+
+def _line_item(statement: pd.DataFrame, item: str, index: pd.DatetimeIndex) -> pd.Series:
+    """Return the first available column for a line item, aligned to ``index``."""
+    for name in LINE_ITEMS[item]:
+        if statement is not None and name in statement.columns:
+            return pd.to_numeric(statement[name], errors="coerce").reindex(index)
+    return pd.Series(np.nan, index=index)
+
+
+def _span_ok(index: pd.DatetimeIndex, lag: int, bounds: tuple) -> np.ndarray:
+    """Whether each period and the one ``lag`` periods earlier are the expected distance apart."""
+    days = pd.Series(index, index=index).diff(lag).dt.days.to_numpy()
+    with np.errstate(invalid="ignore"):
+        return (days >= bounds[0]) & (days <= bounds[1])
+
+
+def compute_ttm_ratios(statements: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Return TTM margins, returns, leverage and growth for every stored quarter."""
+    frames = [frame for frame in statements.values() if frame is not None and len(frame) > 0]
+    if not frames:
+        return pd.DataFrame()
+    index = pd.DatetimeIndex(sorted(set().union(*(frame.index for frame in frames))))
+
+    income = statements.get("income")
+    balance = statements.get("balance")
+    cashflow = statements.get("cashflow")
+
+    flows = pd.DataFrame({
+        item: _line_item(source, item, index)
+        for item, source in [
+            ("revenue", income),
+            ("gross_profit", income),
+            ("operating_income", income),
+            ("net_income", income),
+            ("operating_cash_flow", cashflow),
+            ("capital_expenditure", cashflow),
+        ]
+    })
+    ttm = flows.rolling(4, min_periods=4).sum()
+    ttm.loc[~_span_ok(index, 3, _TTM_SPAN_DAYS)] = np.nan
+
+    equity = _line_item(balance, "equity", index)
+    assets = _line_item(balance, "total_assets", index)
+    debt = _line_item(balance, "total_debt", index)
+    current_assets = _line_item(balance, "current_assets", index)
+    current_liabilities = _line_item(balance, "current_liabilities", index)
+
+    revenue = ttm["revenue"].where(ttm["revenue"] != 0)
+    free_cash_flow = ttm["operating_cash_flow"] + ttm["capital_expenditure"]
+    yoy_ok = _span_ok(index, 4, _YOY_SPAN_DAYS)
+
+    ratios = pd.DataFrame({
+        "Revenue (TTM)": ttm["revenue"],
+        "Gross Margin": ttm["gross_profit"] / revenue,
+        "Operating Margin": ttm["operating_income"] / revenue,
+        "Net Margin": ttm["net_income"] / revenue,
+        "FCF Margin": free_cash_flow / revenue,
+        "ROE": ttm["net_income"] / equity.where(equity > 0),
+        "ROA": ttm["net_income"] / assets.where(assets > 0),
+        "Debt/Equity": debt / equity.where(equity > 0),
+        "Current Ratio": current_assets / current_liabilities.where(current_liabilities > 0),
+        "Revenue Growth (YoY)": ttm["revenue"].pct_change(4, fill_method=None).where(yoy_ok),
+        "Net Income Growth (YoY)": (
+            ttm["net_income"].diff(4) / ttm["net_income"].shift(4).abs()
+        ).where(yoy_ok),
+    }, index=index)
+    return ratios.replace([np.inf, -np.inf], np.nan)
@@ -0,0 +1,217 @@
+"""Pure-NumPy technical indicator kernels.
+
+Every kernel accepts a single series of shape ``(n,)`` or a panel of shape
+``(n, k)`` with time along axis 0 (one column per ticker) and returns arrays of
+the same shape. Leading NaNs are allowed per column, so panels of tickers with
+different listing dates work; interior NaNs are forward filled before
+smoothing. Bars without a full lookback window are NaN.
+
+Wilder smoothing is ``ewm_mean(x, alpha=1 / n)``, matching pandas
+``ewm(alpha=1 / n, adjust=False)``. The recursion is evaluated in closed form
+over blocks of bars, so the Python loop runs once per block rather than once
+per bar.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Largest power of the decay factor allowed within one block (10**50)
+_MAX_BLOCK_EXPONENT = 50.0
+_MAX_BLOCK_SIZE = 256
+
+
+def _as_panel(x) -> Tuple[np.ndarray, tuple]:
+    """Return ``x`` as a float ``(n, k)`` array and its original shape."""
+    arr = np.asarray(x, dtype=float)
+    if arr.ndim not in (1, 2):
+        raise ValueError(f"Expected a 1-D series or 2-D panel, got {arr.ndim} dimensions")
+    return arr.reshape(arr.shape[0], -1), arr.shape
+
+
+def _shift(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Shift a panel down along the time axis, filling with NaN."""
+    out = np.full_like(x, np.nan)
+    if periods < len(x):
+        out[periods:] = x[:-periods]
+    return out
+
+
+def _ffill(x: np.ndarray) -> np.ndarray:
+    """Forward fill NaNs along the time axis."""
+    idx = np.where(np.isnan(x), 0, np.arange(len(x))[:, None])
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    return np.take_along_axis(x, idx, axis=0)
+
+
+def ewm_mean(x, alpha: float) -> np.ndarray:
+    """Exponentially weighted mean, equivalent to pandas ``ewm(alpha, adjust=False)``."""
+    if not 0.0 < alpha <= 1.0:
+        raise ValueError("alpha must be in (0, 1]")
+
+    x2, shape = _as_panel(x)
+    started = np.logical_or.accumulate(~np.isnan(x2), axis=0)
+    filled = np.where(started, _ffill(x2), 0.0)
+
+    decay = 1.0 - alpha
+    if decay == 0.0:
+        return np.where(started, filled, np.nan).reshape(shape)
+
+    # Seed each column with its first valid value: y_first = a * (x_first / a)
+    previously_started = np.zeros_like(started)
+    previously_started[1:] = started[:-1]
+    first = started & ~previously_started
+    filled = np.where(first, filled / alpha, filled)
+
+    block = int(min(_MAX_BLOCK_SIZE, max(1, _MAX_BLOCK_EXPONENT / -np.log10(decay))))
+    exponents = np.arange(block)
+    decay_pow = decay ** exponents
+    decay_inv = decay ** -exponents
+
+    out = np.empty_like(filled)
+    carry = np.zeros(filled.shape[1])
+    for start in range(0, len(filled), block):
+        chunk = filled[start:start + block]
+        m = len(chunk)
+        # y_j = d^(j+1) * carry + a * d^j * sum_{i<=j} d^(-i) * x_i
+        weighted = np.cumsum(chunk * decay_inv[:m, None], axis=0)
+        y = decay_pow[:m, None] * (decay * carry + alpha * weighted)
+        out[start:start + m] = y
+        carry = y[-1]
+
+    return np.where(started, out, np.nan).reshape(shape)
+
+
+def wilder_mean(x, window: int) -> np.ndarray:
+    """Wilder's smoothing over ``window`` bars."""
+    return ewm_mean(x, 1.0 / window)
+
+
+def rolling_mean(x, window: int) -> np.ndarray:
+    """Simple moving average; NaN until ``window`` valid bars are available."""
+    x2, shape = _as_panel(x)
+    valid = ~np.isnan(x2)
+    zeros = np.zeros((1, x2.shape[1]))
+    sums = np.concatenate([zeros, np.cumsum(np.where(valid, x2, 0.0), axis=0)])
+    counts = np.concatenate([zeros, np.cumsum(valid, axis=0)])
+
+    out = np.full_like(x2, np.nan)
+    if window <= len(x2):
+        window_sums = sums[window:] - sums[:-window]
+        window_counts = counts[window:] - counts[:-window]
+        out[window - 1:] = np.where(window_counts == window, window_sums / window, np.nan)
+    return out.reshape(shape)
+
+
+def _rolling_extreme(x, window: int, func) -> np.ndarray:
+    """Apply ``np.max``/``np.min`` over trailing windows; NaN if any value is missing."""
+    x2, shape = _as_panel(x)
+    out = np.full_like(x2, np.nan)
+    if window <= len(x2):
+        windows = np.lib.stride_tricks.sliding_window_view(x2, window, axis=0)
+        out[window - 1:] = func(windows, axis=-1)
+    return out.reshape(shape)
+
+
+def rolling_max(x, window: int) -> np.ndarray:
+    """Highest value over trailing ``window`` bars."""
+    return _rolling_extreme(x, window, np.max)
+
+
+def rolling_min(x, window: int) -> np.ndarray:
+    """Lowest value over trailing ``window`` bars."""
+    return _rolling_extreme(x, window, np.min)
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """True range; the first bar uses ``high - low``."""
+    high, shape = _as_panel(high)
+    low, _ = _as_panel(low)
+    prev_close = _shift(_as_panel(close)[0])
+    tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return tr.reshape(shape)
+
+
+def atr(high, low, close, window: int = 14) -> np.ndarray:
+    """Average true range with Wilder smoothing."""
+    return wilder_mean(true_range(high, low, close), window)
+
+
+def adx(high, low, close, window: int = 14) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Average directional index. Returns ``(adx, plus_di, minus_di)``."""
+    high2, shape = _as_panel(high)
+    low2, _ = _as_panel(low)
+
+    up = high2 - _shift(high2)
+    down = _shift(low2) - low2
+    with np.errstate(invalid="ignore"):
+        plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+        minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+    # Keep each column's leading NaNs so smoothing starts at its first bar
+    missing = np.isnan(high2) | np.isnan(low2)
+    plus_dm[missing] = np.nan
+    minus_dm[missing] = np.nan
+
+    smoothed_tr = atr(high2, low2, _as_panel(close)[0], window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100.0 * wilder_mean(plus_dm, window) / smoothed_tr
+        minus_di = 100.0 * wilder_mean(minus_dm, window) / smoothed_tr
+        di_sum = plus_di + minus_di
+        dx = np.where(di_sum > 0, 100.0 * np.abs(plus_di - minus_di) / di_sum, 0.0)
+    dx[np.isnan(di_sum)] = np.nan
+
+    return (
+        wilder_mean(dx, window).reshape(shape),
+        plus_di.reshape(shape),
+        minus_di.reshape(shape),
+    )
+
+
+def stochastic(
+    high,
+    low,
+    close,
+    k_window: int = 14,
+    d_window: int = 3,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Stochastic oscillator. Returns ``(%K, %D)``; a flat range gives %K = 50."""
+    close2, shape = _as_panel(close)
+    highest = rolling_max(_as_panel(high)[0], k_window)
+    lowest = rolling_min(_as_panel(low)[0], k_window)
+    price_range = highest - lowest
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.where(price_range > 0, 100.0 * (close2 - lowest) / price_range, 50.0)
+    k[np.isnan(price_range) | np.isnan(close2)] = np.nan
+    d = rolling_mean(k, d_window)
+    return k.reshape(shape), d.reshape(shape)
+
+
+def obv(close, volume) -> np.ndarray:
+    """On-balance volume, starting from zero at each column's first bar."""
+    close2, shape = _as_panel(close)
+    volume2, _ = _as_panel(volume)
+    direction = np.nan_to_num(np.sign(close2 - _shift(close2)))
+    flow = direction * np.nan_to_num(volume2)
+    out = np.cumsum(flow, axis=0)
+    out[np.isnan(close2)] = np.nan
+    return out.reshape(shape)
+
+
+def vwap(high, low, close, volume, window: Optional[int] = None) -> np.ndarray:
+    """Volume-weighted average price, anchored at the first bar or over a trailing window."""
+    close2, shape = _as_panel(close)
+    typical = (_as_panel(high)[0] + _as_panel(low)[0] + close2) / 3.0
+    volume2, _ = _as_panel(volume)
+
+    if window is None:
+        valid = ~(np.isnan(typical) | np.isnan(volume2))
+        pv = np.cumsum(np.where(valid, typical * volume2, 0.0), axis=0)
+        vol = np.cumsum(np.where(valid, volume2, 0.0), axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = np.where(vol > 0, pv / vol, np.nan)
+        return out.reshape(shape)
+
+    pv = rolling_mean(typical * volume2, window)
+    vol = rolling_mean(volume2, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(vol > 0, pv / vol, np.nan)
+    return out.reshape(shape)
@@ -0,0 +1,122 @@
+"""Multi-timeframe OHLCV bars derived from a daily series.
+
+Supported rules:
+
+- ``"D"``: the daily bars unchanged;
+- ``"W"``, ``"M"``, ``"Q"``, ``"Y"``: calendar weeks (ending Friday), months,
+  quarters and years;
+- ``"<N>D"``, e.g. ``"3D"``: bins of N calendar days anchored at the Unix epoch.
+
+Each resampled bar is labelled with the date of the last daily bar in its
+period. :func:`update_resampled` recomputes only the periods whose daily bars
+may have changed, so refreshing after new bars arrive touches the newest
+period (and the oldest, when the daily window has rolled forward). Yahoo
+history is split- and dividend-adjusted, so an adjustment rewrites every
+earlier bar; when the daily bars behind the kept periods no longer match,
+everything is resampled.
+"""
+import re
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+PERIOD_FREQS = {"W": "W-FRI", "M": "M", "Q": "Q", "Y": "Y"}
+_DAY_BINS = re.compile(r"^(\d+)D$")
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class ResampledBars(NamedTuple):
+    """Resampled frame with the period code of each row and the daily closes it was built from."""
+
+    rule: str
+    frame: pd.DataFrame
+    codes: np.ndarray
+    closes: Optional[pd.Series] = None
+
+
+def period_codes(index: pd.DatetimeIndex, rule: str) -> np.ndarray:
+    """Return an integer period code per bar; equal codes share a period."""
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    if rule in PERIOD_FREQS:
+        return index.to_period(PERIOD_FREQS[rule]).asi8
+    match = _DAY_BINS.match(rule)
+    if match:
+        days = index.values.astype("datetime64[D]").astype(np.int64)
+        return days // int(match.group(1))
+    raise ValueError(f"Unsupported timeframe rule: {rule!r}")
+
+
+def _aggregate(daily: pd.DataFrame, codes: np.ndarray) -> pd.DataFrame:
+    """Aggregate consecutive bars sharing a code into one OHLCV bar."""
+    if len(daily) == 0:
+        return daily[OHLCV_COLUMNS].copy()
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.r_[starts[1:], len(codes)] - 1
+    return pd.DataFrame(
+        {
+            "Open": daily["Open"].to_numpy()[starts],
+            "High": np.maximum.reduceat(daily["High"].to_numpy(), starts),
+            "Low": np.minimum.reduceat(daily["Low"].to_numpy(), starts),
+            "Close": daily["Close"].to_numpy()[ends],
+            "Volume": np.add.reduceat(daily["Volume"].to_numpy(), starts),
+        },
+        index=daily.index[ends],
+    )
+
+
+def resample_ohlcv(daily: pd.DataFrame, rule: str) -> ResampledBars:
+    """Resample a sorted daily OHLCV frame in one pass."""
+    if rule == "D":
+        frame = daily[OHLCV_COLUMNS].copy()
+        return ResampledBars(rule, frame, np.arange(len(frame), dtype=np.int64), daily["Close"].copy())
+    codes = period_codes(daily.index, rule)
+    return ResampledBars(rule, _aggregate(daily, codes), np.unique(codes), daily["Close"].copy())
+
+
+def _same_bars(previous: pd.Series, current: pd.Series) -> bool:
+    """Whether two daily close series cover the same dates with the same prices."""
+    return previous.index.equals(current.index) and np.allclose(
+        previous.to_numpy(dtype=float), current.to_numpy(dtype=float), rtol=1e-9, atol=0.0, equal_nan=True
+    )
+
+
+def update_resampled(previous: Optional[ResampledBars], daily: pd.DataFrame, rule: str) -> ResampledBars:
+    """Bring ``previous`` up to date with ``daily``, recomputing only edge periods.
+
+    Interior periods of ``previous`` are kept as they are; the first period of
+    the new daily window and every period from ``previous``'s last onwards are
+    rebuilt from the daily bars. If the daily bars of the kept periods changed
+    (a split or dividend adjustment, or revised data), everything is rebuilt.
+    """
+    if (
+        previous is None
+        or previous.rule != rule
+        or rule == "D"
+        or len(previous.codes) == 0
+        or previous.closes is None
+    ):
+        return resample_ohlcv(daily, rule)
+
+    codes = period_codes(daily.index, rule)
+    if len(codes) == 0:
+        return resample_ohlcv(daily, rule)
+
+    keep = (previous.codes > codes[0]) & (previous.codes < previous.codes[-1])
+    kept_codes = previous.codes[keep]
+    rebuild = ~np.isin(codes, kept_codes)
+
+    previous_kept = np.isin(period_codes(previous.closes.index, rule), kept_codes)
+    if not _same_bars(previous.closes[previous_kept], daily["Close"][~rebuild]):
+        return resample_ohlcv(daily, rule)
+
+    rebuilt_codes = codes[rebuild]
+    rebuilt = _aggregate(daily[rebuild], rebuilt_codes)
+    frame = pd.concat([previous.frame[keep], rebuilt])
+    all_codes = np.concatenate([kept_codes, np.unique(rebuilt_codes)])
+
+    order = np.argsort(all_codes, kind="stable")
+    return ResampledBars(rule, frame.iloc[order], all_codes[order], daily["Close"].copy())
@@ -0,0 +1,228 @@
+"""Rolling risk metrics over a return panel.
+
+Like the indicator kernels, every function accepts a series of shape ``(n,)``
+or a panel of shape ``(n, k)`` with time along axis 0 (one column per ticker)
+and returns arrays of the same shape. A metric is NaN until its trailing
+window holds ``window`` valid returns. :func:`compute_risk` runs the kernels
+on each ticker's own trading days, so tickers on different exchange
+calendars can share a panel. Moment-based metrics use cumulative sums,
+historical VaR uses strided window views processed in chunks to bound memory
+on large panels, and the windowed max drawdown advances every window one bar
+at a time, so its loop runs ``window`` times rather than once per bar.
+"""
+from statistics import NormalDist
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from stock_research.analysis.indicators import _as_panel
+
+TRADING_DAYS = 252
+
+# Rows of window views materialized at once
+_CHUNK_ROWS = 256
+
+
+def returns(prices) -> np.ndarray:
+    """Simple returns; the first bar and bars after a missing price are NaN."""
+    prices, shape = _as_panel(prices)
+    out = np.full_like(prices, np.nan)
+    out[1:] = prices[1:] / prices[:-1] - 1.0
+    return out.reshape(shape)
+
+
+def _rolling_sums(x: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Trailing-window sums of ``x`` (NaN as zero) and valid counts, aligned to the window end."""
+    valid = ~np.isnan(x)
+    zeros = np.zeros((1, x.shape[1]))
+    sums = np.concatenate([zeros, np.cumsum(np.where(valid, x, 0.0), axis=0)])
+    counts = np.concatenate([zeros, np.cumsum(valid, axis=0)])
+    out_sums = np.full_like(x, np.nan)
+    out_counts = np.zeros_like(x)
+    if window <= len(x):
+        out_sums[window - 1:] = sums[window:] - sums[:-window]
+        out_counts[window - 1:] = counts[window:] - counts[:-window]
+    return out_sums, out_counts
+
+
+def _rolling_moments(x: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Trailing mean and sample standard deviation over full windows."""
+    sums, counts = _rolling_sums(x, window)
+    squares, _ = _rolling_sums(x * x, window)
+    full = counts == window
+    mean = np.where(full, sums / window, np.nan)
+    variance = (squares - window * mean * mean) / (window - 1)
+    return mean, np.sqrt(np.maximum(variance, 0.0))
+
+
+def rolling_volatility(rets, window: int, periods_per_year: int = TRADING_DAYS) -> np.ndarray:
+    """Annualized realized volatility over trailing ``window`` returns."""
+    rets, shape = _as_panel(rets)
+    _, std = _rolling_moments(rets, window)
+    return (std * np.sqrt(periods_per_year)).reshape(shape)
+
+
+def rolling_beta(rets, benchmark, window: int) -> np.ndarray:
+    """Beta of each column against benchmark returns over trailing windows.
+
+    ``benchmark`` is one return series for all columns, or a panel with one
+    column of benchmark returns per column of ``rets``. Only bars where both
+    the column and the benchmark have a return count.
+    """
+    rets, shape = _as_panel(rets)
+    bench = np.asarray(benchmark, dtype=float)
+    if bench.ndim == 1:
+        bench = bench.reshape(-1, 1)
+    both = ~np.isnan(rets) & ~np.isnan(bench)
+    x = np.where(both, bench, np.nan)
+    y = np.where(both, rets, np.nan)
+
+    sum_x, counts = _rolling_sums(x, window)
+    sum_y, _ = _rolling_sums(y, window)
+    sum_xy, _ = _rolling_sums(x * y, window)
+    sum_xx, _ = _rolling_sums(x * x, window)
+
+    covariance = sum_xy - sum_x * sum_y / window
+    variance = sum_xx - sum_x * sum_x / window
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = np.where((counts == window) & (variance > 0), covariance / variance, np.nan)
+    return beta.reshape(shape)
+
+
+def _apply_windows(
+    x: np.ndarray,
+    window: int,
+    func: Callable[[np.ndarray], Tuple[np.ndarray, ...]],
+    outputs: int = 1,
+) -> Tuple[np.ndarray, ...]:
+    """Apply ``func`` to ``(rows, k, window)`` trailing windows without missing values.
+
+    ``func`` returns ``outputs`` arrays of shape ``(rows, k)``.
+    """
+    results = tuple(np.full_like(x, np.nan) for _ in range(outputs))
+    if window > len(x):
+        return results
+
+    views = np.lib.stride_tricks.sliding_window_view(x, window, axis=0)
+    _, counts = _rolling_sums(x, window)
+    full = counts[window - 1:] == window
+    for start in range(0, len(views), _CHUNK_ROWS):
+        stop = start + _CHUNK_ROWS
+        chunk = np.ascontiguousarray(views[start:stop])
+        for out, values in zip(results, func(chunk)):
+            out[window - 1 + start:window - 1 + stop] = np.where(full[start:stop], values, np.nan)
+    return results
+
+
+def historical_var(rets, window: int, level: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+    """Historical value at risk and conditional VaR over trailing windows.
+
+    Returns ``(var, cvar)`` as positive loss fractions: VaR is the
+    ``1 - level`` empirical quantile of returns and CVaR the mean of the
+    returns at or below it.
+    """
+    rets, shape = _as_panel(rets)
+    tail = max(1, int(np.ceil((1.0 - level) * window)))
+
+    def var_cvar(views: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        worst = np.partition(views, tail - 1, axis=-1)[..., :tail]
+        return -worst[..., tail - 1], -worst.mean(axis=-1)
+
+    var, cvar = _apply_windows(rets, window, var_cvar, outputs=2)
+    return var.reshape(shape), cvar.reshape(shape)
+
+
+def parametric_var(rets, window: int, level: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+    """Gaussian value at risk and conditional VaR from trailing mean and volatility."""
+    rets, shape = _as_panel(rets)
+    mean, std = _rolling_moments(rets, window)
+    z = NormalDist().inv_cdf(level)
+    tail_mean = NormalDist().pdf(z) / (1.0 - level)
+    return (z * std - mean).reshape(shape), (tail_mean * std - mean).reshape(shape)
+
+
+def drawdown(prices) -> np.ndarray:
+    """Decline from the running peak, as a non-positive fraction."""
+    prices, shape = _as_panel(prices)
+    peak = np.fmax.accumulate(prices, axis=0)
+    return (prices / peak - 1.0).reshape(shape)
+
+
+def max_drawdown(prices, window: Optional[int] = None) -> np.ndarray:
+    """Worst drawdown to date, or within each trailing ``window`` of prices."""
+    prices, shape = _as_panel(prices)
+    if window is None:
+        return np.fmin.accumulate(drawdown(prices), axis=0).reshape(shape)
+
+    out = np.full_like(prices, np.nan)
+    if window > len(prices):
+        return out.reshape(shape)
+
+    # Walk all windows forward in step, one offset at a time, tracking each window's peak
+    starts = len(prices) - window + 1
+    peak = prices[:starts].copy()
+    worst = np.zeros_like(peak)
+    for offset in range(1, window):
+        current = prices[offset:offset + starts]
+        peak = np.maximum(peak, current)
+        worst = np.minimum(worst, current / peak - 1.0)
+
+    _, counts = _rolling_sums(prices, window)
+    out[window - 1:] = np.where(counts[window - 1:] == window, worst, np.nan)
+    return out.reshape(shape)
+
+
+RISK_METRICS = [
+    "Beta", "Volatility", "VaR (Historical)", "CVaR (Historical)",
+    "VaR (Parametric)", "CVaR (Parametric)", "Drawdown", "Max Drawdown",
+]
+
+
+def compute_risk(
+    closes: pd.DataFrame,
+    benchmark: pd.Series,
+    window: int = 63,
+    level: float = 0.95,
+) -> Dict[str, pd.DataFrame]:
+    """Return every metric in ``RISK_METRICS`` as a dates x tickers frame.
+
+    ``closes`` holds one column of prices per ticker, NaN on dates the ticker
+    did not trade, and ``benchmark`` the benchmark prices. Every metric is
+    computed over each ticker's own trading days and is NaN on the others.
+    Beta compares each return with the benchmark's move over the same
+    interval, using the last benchmark price on or before each date.
+    ``Max Drawdown`` is measured over the trailing window; ``Drawdown`` is
+    from the all-time peak of the history.
+    """
+    index = closes.index
+    bench = benchmark.reindex(index.union(benchmark.index)).ffill().reindex(index).to_numpy(dtype=float)
+    prices = closes.to_numpy(dtype=float)
+
+    # Move each ticker's trading days to the top of its column, in date order
+    traded = ~np.isnan(prices)
+    order = np.argsort(~traded, axis=0, kind="stable")
+    padding = np.arange(len(index))[:, None] >= traded.sum(axis=0)
+    own = np.take_along_axis(prices, order, axis=0)
+    bench_own = np.where(padding, np.nan, bench[order])
+
+    panel = returns(own)
+    hist_var, hist_cvar = historical_var(panel, window, level)
+    param_var, param_cvar = parametric_var(panel, window, level)
+    values = {
+        "Beta": rolling_beta(panel, returns(bench_own), window),
+        "Volatility": rolling_volatility(panel, window),
+        "VaR (Historical)": hist_var,
+        "CVaR (Historical)": hist_cvar,
+        "VaR (Parametric)": param_var,
+        "CVaR (Parametric)": param_cvar,
+        "Drawdown": drawdown(own),
+        "Max Drawdown": max_drawdown(own, window + 1),
+    }
+
+    def on_dates(metric: np.ndarray) -> pd.DataFrame:
+        out = np.empty_like(prices)
+        np.put_along_axis(out, order, np.where(padding, np.nan, metric), axis=0)
+        return pd.DataFrame(out, index=index, columns=closes.columns)
+
+    return {name: on_dates(values[name]) for name in RISK_METRICS}
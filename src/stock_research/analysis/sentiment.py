@@ -0,0 +1,76 @@
+"""Keyword sentiment scoring for news items."""
+from datetime import datetime
+
+
+def calculate_sentiment(text: str) -> int:
+    """Calculate a simple sentiment score based on keywords."""
+    if not isinstance(text, str):
+        return 0
+
+    positive_words = ['rise', 'gain', 'up', 'surge', 'jump', 'boost', 'positive', 'strong', 'success', 'bullish']
+    negative_words = ['fall', 'drop', 'down', 'decline', 'weak', 'negative', 'loss', 'risk', 'concern', 'bearish']
+
+    text = text.lower()
+    positive_count = sum(1 for word in positive_words if word in text)
+    negative_count = sum(1 for word in negative_words if word in text)
+
+    return positive_count - negative_count
+
+
+def parse_news_date(date_str: str) -> datetime:
+    """Parse date string to datetime object."""
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%SZ')
+    except ValueError:
+        try:
+            return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            return datetime.now()
+
+
+def score_news(news: list) -> list:
+    """Score raw news items and normalize them into flat dicts."""
+    processed_news = []
+    for item in news:
+        try:
+            if 'content' in item:
+                content = item['content']
+                title = content.get('title', '')
+                summary = content.get('summary', '')
+                date = content.get('pubDate', '')
+                url = content.get('previewUrl', '')
+            else:
+                title = item.get('title', '')
+                summary = item.get('summary', '')
+                date = item.get('pubDate', '')
+                url = item.get('previewUrl', '')
+
+            sentiment_score = calculate_sentiment(title) + calculate_sentiment(summary)
+            sentiment_category = (
+                'positive' if sentiment_score > 0
+                else 'negative' if sentiment_score < 0
+                else 'neutral'
+            )
+
+            news_item = {
+                'title': title,
+                'summary': summary,
+                'date': parse_news_date(date) if date else datetime.now(),
+                'url': url,
+                'sentiment_score': sentiment_score,
+                'sentiment_category': sentiment_category
+            }
+            processed_news.append(news_item)
+        except Exception:
+            continue
+    return processed_news
+
+
+def summarize_news(processed_news: list) -> dict:
+    """Count scored news items per sentiment category."""
+    return {
+        'total': len(processed_news),
+        'positive': sum(1 for item in processed_news if item['sentiment_category'] == 'positive'),
+        'negative': sum(1 for item in processed_news if item['sentiment_category'] == 'negative'),
+        'neutral': sum(1 for item in processed_news if item['sentiment_category'] == 'neutral'),
+    }
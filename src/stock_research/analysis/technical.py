@@ -0,0 +1,101 @@
+"""Technical indicator frames and the signals derived from them."""
+import pandas as pd
+
+from stock_research.analysis import indicators
+
+NOT_AVAILABLE = "N/A"
+
+# Columns of the frame returned by calculate_technical_indicators
+INDICATOR_COLUMNS = [
+    "Open", "High", "Low", "Close", "Volume",
+    "SMA20", "SMA50", "SMA200", "RSI", "MACD", "Signal_Line",
+    "BB_middle", "BB_upper", "BB_lower", "ATR", "ADX", "Plus_DI", "Minus_DI",
+    "Stoch_K", "Stoch_D", "OBV", "VWAP",
+]
+
+# Indicator columns each signal reads, besides Close
+SIGNAL_INPUTS = {
+    "Price vs SMA20": ["SMA20"],
+    "Price vs SMA50": ["SMA50"],
+    "Price vs SMA200": ["SMA200"],
+    "ADX": ["ADX"],
+    "RSI": ["RSI"],
+    "MACD": ["MACD", "Signal_Line"],
+    "Stochastic": ["Stoch_K"],
+    "Bollinger Bands": ["BB_upper", "BB_lower"],
+    "ATR % of Price": ["ATR"],
+    "OBV (20-day)": ["OBV"],
+    "Price vs VWAP": ["VWAP"],
+}
+SIGNAL_NAMES = list(SIGNAL_INPUTS)
+
+
+def calculate_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """Calculate technical indicators for the given dataframe."""
+    # Calculate moving averages
+    df['SMA20'] = df['Close'].rolling(window=20).mean()
+    df['SMA50'] = df['Close'].rolling(window=50).mean()
+    df['SMA200'] = df['Close'].rolling(window=200).mean()
+
+    # Calculate RSI
+    delta = df['Close'].diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    rs = gain / loss
+    df['RSI'] = 100 - (100 / (1 + rs))
+
+    # Calculate MACD
+    exp1 = df['Close'].ewm(span=12, adjust=False).mean()
+    exp2 = df['Close'].ewm(span=26, adjust=False).mean()
+    df['MACD'] = exp1 - exp2
+    df['Signal_Line'] = df['MACD'].ewm(span=9, adjust=False).mean()
+
+    # Calculate Bollinger Bands
+    df['BB_middle'] = df['Close'].rolling(window=20).mean()
+    df['BB_upper'] = df['BB_middle'] + 2*df['Close'].rolling(window=20).std()
+    df['BB_lower'] = df['BB_middle'] - 2*df['Close'].rolling(window=20).std()
+
+    # Calculate volatility, trend strength and volume indicators
+    high, low, close, volume = (df[col].to_numpy() for col in ['High', 'Low', 'Close', 'Volume'])
+    df['ATR'] = indicators.atr(high, low, close, 14)
+    df['ADX'], df['Plus_DI'], df['Minus_DI'] = indicators.adx(high, low, close, 14)
+    df['Stoch_K'], df['Stoch_D'] = indicators.stochastic(high, low, close, 14, 3)
+    df['OBV'] = indicators.obv(close, volume)
+    df['VWAP'] = indicators.vwap(high, low, close, volume, window=20)
+
+    return df
+
+
+def get_technical_signals(df: pd.DataFrame) -> dict:
+    """Generate technical analysis signals; a signal is "N/A" while its indicators are undefined."""
+    current_price = df['Close'].iloc[-1]
+    signals = {
+        "Trend Signals": {
+            "Price vs SMA20": "Bullish" if current_price > df['SMA20'].iloc[-1] else "Bearish",
+            "Price vs SMA50": "Bullish" if current_price > df['SMA50'].iloc[-1] else "Bearish",
+            "Price vs SMA200": "Bullish" if current_price > df['SMA200'].iloc[-1] else "Bearish",
+            "ADX": "Strong Trend" if df['ADX'].iloc[-1] > 25 else "Weak Trend",
+        },
+        "Momentum Signals": {
+            "RSI": "Overbought" if df['RSI'].iloc[-1] > 70 else "Oversold" if df['RSI'].iloc[-1] < 30 else "Neutral",
+            "MACD": "Bullish" if df['MACD'].iloc[-1] > df['Signal_Line'].iloc[-1] else "Bearish",
+            "Stochastic": "Overbought" if df['Stoch_K'].iloc[-1] > 80 else "Oversold" if df['Stoch_K'].iloc[-1] < 20 else "Neutral",
+        },
+        "Volatility Signals": {
+            "Bollinger Bands": "Upper Band" if current_price > df['BB_upper'].iloc[-1] else
+                             "Lower Band" if current_price < df['BB_lower'].iloc[-1] else "Middle Band",
+            "ATR % of Price": f"{df['ATR'].iloc[-1] / current_price * 100:.2f}%",
+        },
+        "Volume Signals": {
+            "OBV (20-day)": "Rising" if len(df) > 20 and df['OBV'].iloc[-1] > df['OBV'].iloc[-21] else
+                            "Falling" if len(df) > 20 else NOT_AVAILABLE,
+            "Price vs VWAP": "Bullish" if current_price > df['VWAP'].iloc[-1] else "Bearish",
+        },
+    }
+
+    latest = df.iloc[-1]
+    for category_signals in signals.values():
+        for name in category_signals:
+            if pd.isna(current_price) or latest[SIGNAL_INPUTS[name]].isna().any():
+                category_signals[name] = NOT_AVAILABLE
+    return signals
@@ -0,0 +1 @@
+"""Headless JSON API for stock research application."""
@@ -0,0 +1,301 @@
+"""ASGI application serving the analyses as JSON.
+
+Run with any ASGI server, e.g.::
+
+    uvicorn stock_research.api.app:app --workers 4
+
+Routes (GET or HEAD):
+
+- ``/health``
+- ``/metrics``: rate-limiter queue wait metrics, shared across processes
+- ``/fundamentals/{ticker}``, ``/technical/{ticker}?bars=N``, ``/sentiment/{ticker}``
+- ``/fundamentals?tickers=AAPL,MSFT`` (and likewise for the other analyses)
+
+Responses carry an ETag and honour ``If-None-Match``. Per-ticker payloads are
+kept in an in-process TTL cache and concurrent misses for the same payload
+share a single computation. Tickers without data are remembered for
+``settings.API_NOT_FOUND_TTL`` seconds, so polling an unknown symbol does not
+reach upstream on every request.
+"""
+import asyncio
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from stock_research.config.settings import settings
+from stock_research.analysis.sentiment import summarize_news
+from stock_research.data import loaders
+from stock_research.data.ratelimit import rate_limiter
+
+TICKER_PATTERN = re.compile(r"^[A-Z0-9.\-^=]{1,15}$")
+MAX_BARS = 500
+
+
+class ResponseCache:
+    """LRU cache of serialized payloads with a fixed TTL."""
+
+    def __init__(self, ttl: int, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, Tuple[float, Any, bytes, str]]" = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[Tuple[Any, bytes, str]]:
+        """Return ``(payload, body, etag)`` if present and fresh."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, payload, body, etag = entry
+        if time.monotonic() > expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload, body, etag
+
+    def set(self, key: tuple, payload: Any, body: bytes, etag: str, ttl: Optional[int] = None) -> None:
+        """Store a payload, evicting the least recently used entry when full."""
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires, payload, body, etag)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the json module does not handle natively."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _serialize(payload: Any) -> Tuple[bytes, str]:
+    """Return the JSON body and its strong ETag."""
+    body = json.dumps(payload, default=_json_default, separators=(",", ":")).encode("utf-8")
+    return body, '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+class AnalysisNotFound(Exception):
+    """Raised by an analysis when there is no data for the ticker."""
+
+
+def _fundamentals(ticker: str, params: Dict[str, str]) -> dict:
+    """Build the fundamentals payload."""
+    return {"ticker": ticker, "fundamentals": loaders.get_fundamentals(ticker)}
+
+
+def _technical(ticker: str, params: Dict[str, str]) -> dict:
+    """Build the technical indicators and signals payload."""
+    df, signals = loaders.load_technical(ticker)
+    if len(df) == 0:
+        raise AnalysisNotFound(f"No historical data found for {ticker}")
+
+    bars = int(params["bars"])
+    indicators = json.loads(df.tail(bars).to_json(orient="split", date_format="iso"))
+    return {"ticker": ticker, "signals": signals, "indicators": indicators}
+
+
+def _sentiment(ticker: str, params: Dict[str, str]) -> dict:
+    """Build the news sentiment payload."""
+    news, scored = loaders.load_scored_news(ticker)
+    return {
+        "ticker": ticker,
+        "summary": summarize_news(scored),
+        "news": sorted(scored, key=lambda item: item["date"], reverse=True),
+    }
+
+
+ANALYSES: Dict[str, Callable[[str, Dict[str, str]], dict]] = {
+    "fundamentals": _fundamentals,
+    "technical": _technical,
+    "sentiment": _sentiment,
+}
+
+
+class HTTPError(Exception):
+    """Error mapped to an HTTP status code."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class AnalysisAPI:
+    """Minimal ASGI application for the analysis endpoints."""
+
+    def __init__(self):
+        self.cache = ResponseCache(settings.API_CACHE_TTL, settings.API_CACHE_SIZE)
+        self.executor = ThreadPoolExecutor(max_workers=settings.API_WORKERS)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] not in ("GET", "HEAD"):
+            await self._send(send, scope, 405, *_serialize({"error": "Method not allowed"}))
+            return
+
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        params = {k: v[-1] for k, v in parse_qs(scope["query_string"].decode("latin-1")).items()}
+
+        try:
+            body, etag = await self._route(scope["path"], params)
+        except HTTPError as e:
+            await self._send(send, scope, e.status, *_serialize({"error": e.message}))
+            return
+
+        if etag in _parse_etags(headers.get("if-none-match", "")):
+            await self._send(send, scope, 304, b"", etag)
+        else:
+            await self._send(send, scope, 200, body, etag)
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        """Handle ASGI lifespan events."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _route(self, path: str, params: Dict[str, str]) -> Tuple[bytes, str]:
+        """Dispatch a request path to its handler."""
+        parts = [part for part in path.split("/") if part]
+        if parts == ["health"]:
+            return _serialize({"status": "ok"})
+        if parts == ["metrics"]:
+            return _serialize({"rate_limits": rate_limiter.get_metrics()})
+        if not parts or parts[0] not in ANALYSES or len(parts) > 2:
+            raise HTTPError(404, "Not found")
+
+        kind = parts[0]
+        params = self._normalize_params(kind, params)
+
+        if len(parts) == 2:
+            ticker = _validate_ticker(parts[1])
+            _, body, etag = await self._payload(kind, ticker, params)
+            return body, etag
+
+        tickers = [_validate_ticker(t) for t in params.pop("tickers", "").split(",") if t.strip()]
+        if not tickers:
+            raise HTTPError(400, "Query parameter 'tickers' is required")
+        if len(tickers) > settings.API_MAX_BATCH:
+            raise HTTPError(400, f"At most {settings.API_MAX_BATCH} tickers per request")
+
+        tickers = list(dict.fromkeys(tickers))
+        outcomes = await asyncio.gather(
+            *(self._payload(kind, ticker, params) for ticker in tickers),
+            return_exceptions=True,
+        )
+        results, errors = {}, {}
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, HTTPError):
+                errors[ticker] = outcome.message
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[ticker] = outcome[0]
+        return _serialize({"results": results, "errors": errors})
+
+    @staticmethod
+    def _normalize_params(kind: str, params: Dict[str, str]) -> Dict[str, str]:
+        """Keep only the parameters an analysis uses, with defaults applied."""
+        normalized = {}
+        if "tickers" in params:
+            normalized["tickers"] = params["tickers"]
+        if kind == "technical":
+            try:
+                bars = int(params.get("bars", 1))
+            except ValueError:
+                raise HTTPError(400, "Query parameter 'bars' must be an integer")
+            normalized["bars"] = str(min(max(bars, 1), MAX_BARS))
+        return normalized
+
+    async def _payload(self, kind: str, ticker: str, params: Dict[str, str]) -> Tuple[Any, bytes, str]:
+        """Return a cached payload, computing it at most once concurrently."""
+        key = (kind, ticker, tuple(sorted(params.items())))
+        cached = self.cache.get(key)
+        if cached is not None:
+            if isinstance(cached[0], AnalysisNotFound):
+                raise HTTPError(404, str(cached[0]))
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not this request: compute it here instead.
+                if not inflight.cancelled():
+                    raise
+                return await self._payload(kind, ticker, params)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            payload = await loop.run_in_executor(self.executor, ANALYSES[kind], ticker, params)
+            body, etag = _serialize(payload)
+            result = (payload, body, etag)
+            self.cache.set(key, *result)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except AnalysisNotFound as e:
+            self.cache.set(key, e, b"", "", ttl=settings.API_NOT_FOUND_TTL)
+            error = HTTPError(404, str(e))
+        except Exception as e:
+            error = HTTPError(502, f"Error analyzing {kind} for {ticker}: {e}")
+        finally:
+            del self._inflight[key]
+
+        future.set_exception(error)
+        # Mark the exception as retrieved when nobody else was waiting on it.
+        future.exception()
+        raise error
+
+    @staticmethod
+    async def _send(send: Callable, scope: dict, status: int, body: bytes, etag: str) -> None:
+        """Send a complete JSON response."""
+        headers: List[Tuple[bytes, bytes]] = [
+            (b"content-type", b"application/json"),
+            (b"etag", etag.encode("latin-1")),
+        ]
+        if status in (200, 304):
+            headers.append((b"cache-control", f"max-age={settings.API_CACHE_TTL}".encode("latin-1")))
+        if status != 304:
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        send_body = b"" if status == 304 or scope["method"] == "HEAD" else body
+        await send({"type": "http.response.body", "body": send_body})
+
+
+def _validate_ticker(value: str) -> str:
+    """Normalize and validate a ticker symbol."""
+    ticker = value.strip().upper()
+    if not TICKER_PATTERN.match(ticker):
+        raise HTTPError(400, f"Invalid ticker: {value!r}")
+    return ticker
+
+
+def _parse_etags(header: str) -> List[str]:
+    """Parse an ``If-None-Match`` header into a list of ETags."""
+    return [tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()]
+
+
+app = AnalysisAPI()
@@ -17,24 +17,96 @@ class Settings(BaseSettings):
     DEFAULT_MODEL: str = "openai:gpt-4"
     TEMPERATURE: float = 0.7
     MAX_TOKENS: int = 1000
+    CONTEXT_TOKEN_BUDGET: int = 400  # Max prompt tokens spent on precomputed market data
     
     # Cache Settings
     CACHE_DIR: Path = BASE_DIR / ".cache"
     CACHE_TTL: int = 3600  # 1 hour
     
+    # Freshness Settings (seconds, per data type)
+    FRESHNESS: dict[str, int] = {  # Served from cache without refreshing
+        "history": 300,
+        "info": 3600,
+        "news": 900,
+        "statements": 86400,
+        "options": 900,
+        "stocktwits": 300,
+    }
+    MAX_STALENESS: dict[str, int] = {  # Served from cache while refreshing in the background
+        "history": 3 * 86400,
+        "info": 7 * 86400,
+        "news": 86400,
+        "statements": 90 * 86400,
+        "options": 86400,
+        "stocktwits": 86400,
+    }
+    HEDGE_AFTER: float = 2.0  # Seconds before issuing a hedged duplicate request
+    REQUEST_TIMEOUT: float = 10.0  # Seconds before a direct HTTP request to an upstream API is abandoned
+    REVALIDATE_WORKERS: int = 4
+    
+    # Rate Limit Settings (requests per second and burst size, per upstream host)
+    RATE_LIMITS: dict[str, tuple[float, int]] = {
+        "yahoo": (2.0, 5),
+        "stocktwits": (0.5, 3),
+    }
+    RATE_LIMIT_DB: Path = CACHE_DIR / "ratelimit.sqlite3"
+    RATE_LIMIT_BATCH_RESERVE: float = 0.5  # Share of the burst held back for interactive requests
+    RATE_LIMIT_TIMEOUT: float = 30.0  # Max seconds to wait for a token
+    
+    # Cache Warmer Settings
+    WATCHLIST: list[str] = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA"]
+    USAGE_DB: Path = CACHE_DIR / "usage.sqlite3"
+    USAGE_WINDOW_DAYS: int = 14
+    MARKET_TIMEZONE: str = "America/New_York"
+    MARKET_OPEN: str = "09:30"
+    MARKET_CLOSE: str = "16:00"
+    WARMER_PREMARKET_START: str = "07:30"
+    WARMER_QUIET_MINUTES: int = 15  # Idle time before warming during the session
+    WARMER_INTERVAL: int = 1800  # Min seconds between warm runs
+    WARMER_CONCURRENCY: int = 2  # Max tickers warmed in parallel
+    
+    # API Settings
+    API_CACHE_TTL: int = 60  # Seconds a rendered response is served from memory
+    API_CACHE_SIZE: int = 2048  # Max cached responses
+    API_NOT_FOUND_TTL: int = 30  # Seconds a ticker without data is answered with 404 from memory
+    API_WORKERS: int = 16  # Threads for blocking data fetches and computation
+    API_MAX_BATCH: int = 50  # Max tickers per batch request
+    
+    # Alert Settings
+    ALERT_RULES_FILE: Path = BASE_DIR / "alerts.json"
+    ALERT_LOG_FILE: Path = CACHE_DIR / "alerts.jsonl"
+    ALERT_WEBHOOK_URL: Optional[str] = None
+    ALERT_INTERVAL: int = 300  # Seconds between evaluations
+    
     # Streamlit Settings
     PAGE_TITLE: str = "Stock Market Research Assistant"
     PAGE_ICON: str = "📈"
     
     # Market Data Settings
-    DEFAULT_TIMEFRAME: str = "1y"
+    HISTORY_PERIOD: str = "5y"  # Daily history held locally; other timeframes are derived from it
+    DEFAULT_TIMEFRAME: str = "Daily"
+    DAILY_CHART_DAYS: int = 365  # Daily candles shown; indicators still use the full history
+    TIMEFRAMES: dict[str, str] = {  # Label -> resample rule (see analysis.resample)
+        "Daily": "D",
+        "Weekly": "W",
+        "Monthly": "M",
+    }
     TECHNICAL_INDICATORS: list[str] = [
-        "SMA_50",
-        "SMA_200",
+        "SMA50",
+        "SMA200",
         "RSI",
         "MACD",
     ]
     
+    # Options Settings
+    RISK_FREE_RATE: float = 0.04  # Continuously compounded, used for implied volatility and Greeks
+    OPTIONS_MONEYNESS_RANGE: tuple[float, float] = (0.7, 1.3)  # Strike / spot shown on the surface
+    
+    # Risk Settings
+    RISK_BENCHMARK: str = "SPY"
+    RISK_WINDOW: int = 63  # Trading days in each rolling window
+    RISK_VAR_LEVEL: float = 0.95  # Confidence level for VaR and CVaR
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
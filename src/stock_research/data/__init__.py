@@ -0,0 +1 @@
+"""Market data access layer for stock research application."""
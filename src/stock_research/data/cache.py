@@ -0,0 +1,69 @@
+"""On-disk cache for fetched market data and precomputed analyses.
+
+Entries are pickled under ``settings.CACHE_DIR`` so they are shared by every
+worker process on the machine, including the background cache warmer.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from stock_research.config.settings import settings
+
+
+class DiskCache:
+    """Pickle-per-entry cache keyed by ``(kind, key)``."""
+
+    def __init__(self, root: Optional[Path] = None, ttl: Optional[int] = None):
+        self.root = Path(root or settings.CACHE_DIR / "data")
+        self.ttl = settings.CACHE_TTL if ttl is None else ttl
+
+    def _path(self, kind: str, key: str) -> Path:
+        """Return the file path for an entry."""
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return self.root / kind / f"{digest}.pkl"
+
+    def get_entry(self, kind: str, key: str) -> Optional[Tuple[Any, float]]:
+        """Return ``(value, stored_at)`` regardless of age, or None if missing."""
+        try:
+            with open(self._path(kind, key), "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def get(self, kind: str, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Return a cached value younger than ``max_age`` seconds, else None."""
+        entry = self.get_entry(kind, key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        max_age = self.ttl if max_age is None else max_age
+        if time.time() - stored_at > max_age:
+            return None
+        return value
+
+    def set(self, kind: str, key: str, value: Any) -> None:
+        """Store a value atomically so concurrent readers never see partial files."""
+        path = self._path(kind, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((value, time.time()), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def age(self, kind: str, key: str) -> Optional[float]:
+        """Return the age of an entry in seconds, or None if missing."""
+        entry = self.get_entry(kind, key)
+        return None if entry is None else time.time() - entry[1]
+
+
+# Shared cache instance
+cache = DiskCache()
@@ -0,0 +1,197 @@
+"""Cached analyses built on top of the market data layer.
+
+Each loader fetches its inputs through ``stock_research.data.market`` and
+recomputes only when the fetch stamp of those inputs changes, so the UI, the
+API, the cache warmer, the alert engine and the agents all share the same
+precomputed results without importing Streamlit.
+"""
+from typing import Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from stock_research.analysis.financials import compute_ttm_ratios
+from stock_research.analysis.options import analyze_chain
+from stock_research.analysis.resample import update_resampled
+from stock_research.analysis.risk import compute_risk
+from stock_research.analysis.sentiment import score_news
+from stock_research.analysis.technical import calculate_technical_indicators, get_technical_signals
+from stock_research.config.settings import settings
+from stock_research.data import market
+from stock_research.data.cache import cache
+from stock_research.data.ratelimit import INTERACTIVE
+
+
+FUNDAMENTAL_FIELDS = [
+    'marketCap', 'trailingPE', 'dividendYield',
+    'grossMargins', 'operatingMargins', 'profitMargins', 'returnOnEquity', 'returnOnAssets',
+    'priceToBook', 'priceToSalesTrailing12Months', 'enterpriseToEbitda', 'pegRatio',
+    'revenueGrowth', 'earningsGrowth',
+    'quickRatio', 'debtToEquity', 'currentRatio',
+]
+
+
+def get_fundamentals(ticker: str, priority: int = INTERACTIVE) -> dict:
+    """Return the fundamental metrics shown in the analysis, as raw values."""
+    info = market.get_info(ticker, priority=priority)
+    return {field: info.get(field) for field in FUNDAMENTAL_FIELDS}
+
+
+def load_ratios(ticker: str, priority: int = INTERACTIVE, refresh: bool = False) -> pd.DataFrame:
+    """Return TTM ratio series, recomputed only when the statements change."""
+    statements = market.get_statements(ticker, priority=priority, refresh=refresh)
+
+    stamp = market.fetched_at("statements", ticker)
+    entry = cache.get_entry("ratios", ticker)
+    if entry is not None and entry[0][0] == stamp:
+        return entry[0][1]
+
+    ratios = compute_ttm_ratios(statements)
+    cache.set("ratios", ticker, (stamp, ratios))
+    return ratios
+
+
+def load_technical(
+    ticker: str,
+    priority: int = INTERACTIVE,
+    refresh: bool = False,
+) -> Tuple[pd.DataFrame, Optional[dict]]:
+    """Return the indicator frame and signals, recomputed only when the history changes."""
+    hist = market.get_history(ticker, priority=priority, refresh=refresh)
+    if len(hist) == 0:
+        return hist, None
+
+    stamp = market.fetched_at("history", market.history_key(ticker))
+    entry = cache.get_entry("technical", ticker)
+    if entry is not None and entry[0][0] == stamp:
+        _, df, signals = entry[0]
+        return df, signals
+
+    df = calculate_technical_indicators(hist.copy())
+    signals = get_technical_signals(df)
+    cache.set("technical", ticker, (stamp, df, signals))
+    return df, signals
+
+
+def load_timeframe(
+    ticker: str,
+    timeframe: str,
+    priority: int = INTERACTIVE,
+    refresh: bool = False,
+) -> Tuple[pd.DataFrame, Optional[dict]]:
+    """Return indicators and signals for a timeframe derived from the daily history."""
+    rule = settings.TIMEFRAMES[timeframe]
+    if rule == "D":
+        return load_technical(ticker, priority=priority, refresh=refresh)
+
+    hist = market.get_history(ticker, priority=priority, refresh=refresh)
+    if len(hist) == 0:
+        return hist, None
+
+    key = f"{ticker}:{rule}"
+    stamp = market.fetched_at("history", market.history_key(ticker))
+    entry = cache.get_entry("timeframe", key)
+    previous = None
+    if entry is not None:
+        cached_stamp, bars, df, signals = entry[0]
+        if cached_stamp == stamp:
+            return df, signals
+        previous = bars
+
+    bars = update_resampled(previous, hist, rule)
+    df = calculate_technical_indicators(bars.frame.copy())
+    signals = get_technical_signals(df)
+    cache.set("timeframe", key, (stamp, bars, df, signals))
+    return df, signals
+
+
+def _daily_closes(hist: pd.DataFrame) -> pd.Series:
+    """Return closing prices indexed by naive dates, so tickers on different exchanges align."""
+    close = hist['Close']
+    if close.index.tz is not None:
+        close = close.tz_localize(None)
+    return close.set_axis(close.index.normalize())
+
+
+def load_risk(
+    tickers: Sequence[str],
+    priority: int = INTERACTIVE,
+    refresh: bool = False,
+) -> Dict[str, pd.DataFrame]:
+    """Return rolling risk metrics for one or more tickers, recomputed only when a history changes.
+
+    Each metric is a dates x tickers frame computed from daily closes against
+    ``settings.RISK_BENCHMARK``.
+    """
+    tickers = list(tickers)
+    benchmark = settings.RISK_BENCHMARK
+    histories = {
+        symbol: market.get_history(symbol, priority=priority, refresh=refresh)
+        for symbol in dict.fromkeys(tickers + [benchmark])
+    }
+
+    key = f"{','.join(tickers)}:{benchmark}:{settings.RISK_WINDOW}:{settings.RISK_VAR_LEVEL}"
+    stamp = tuple(market.fetched_at("history", market.history_key(symbol)) for symbol in histories)
+    entry = cache.get_entry("risk", key)
+    if entry is not None and entry[0][0] == stamp:
+        return entry[0][1]
+
+    closes = pd.DataFrame({
+        symbol: _daily_closes(histories[symbol]) for symbol in tickers if len(histories[symbol]) > 0
+    })
+    if len(closes.columns) == 0 or len(histories[benchmark]) == 0:
+        return {}
+
+    risk = compute_risk(
+        closes,
+        _daily_closes(histories[benchmark]),
+        window=settings.RISK_WINDOW,
+        level=settings.RISK_VAR_LEVEL,
+    )
+    cache.set("risk", key, (stamp, risk))
+    return risk
+
+
+def load_scored_news(ticker: str, priority: int = INTERACTIVE, refresh: bool = False) -> tuple:
+    """Return ``(raw_news, scored_news)``, rescored only when the news changes."""
+    news = market.get_news(ticker, priority=priority, refresh=refresh)
+
+    stamp = market.fetched_at("news", ticker)
+    entry = cache.get_entry("scored_news", ticker)
+    if entry is not None and entry[0][0] == stamp:
+        return news, entry[0][1]
+
+    scored = score_news(news)
+    cache.set("scored_news", ticker, (stamp, scored))
+    return news, scored
+
+
+def load_options(
+    ticker: str,
+    priority: int = INTERACTIVE,
+    refresh: bool = False,
+) -> Tuple[pd.DataFrame, Optional[float]]:
+    """Return the solved chain and the spot price, recomputed only when the chains change.
+
+    Spot is the underlying price quoted with the chains, so it is as fresh as
+    the option quotes. Without one the raw chain is returned with no spot.
+    """
+    chain = market.get_option_chains(ticker, priority=priority, refresh=refresh)
+    if len(chain) == 0:
+        return pd.DataFrame(), None
+
+    quotes = chain['underlyingPrice'].dropna() if 'underlyingPrice' in chain else pd.Series(dtype=float)
+    if len(quotes) == 0:
+        return chain, None
+
+    stamp = market.fetched_at("options", ticker)
+    entry = cache.get_entry("options_analytics", ticker)
+    if entry is not None and entry[0][0] == stamp:
+        _, solved, spot = entry[0]
+        return solved, spot
+
+    # Quotes of the last expiry fetched are the latest; time to expiry is measured from the fetch
+    spot = float(quotes.iloc[-1])
+    as_of = pd.Timestamp(stamp, unit='s', tz='UTC').tz_convert(settings.MARKET_TIMEZONE).tz_localize(None)
+    solved = analyze_chain(chain, spot, as_of, rate=settings.RISK_FREE_RATE)
+    cache.set("options_analytics", ticker, (stamp, solved, spot))
+    return solved, spot
@@ -0,0 +1,316 @@
+"""Cached, rate-limited access to Yahoo Finance and StockTwits data.
+
+Reads follow a stale-while-revalidate policy per data type:
+
+- younger than ``settings.FRESHNESS[kind]``: served from the cache;
+- younger than ``settings.MAX_STALENESS[kind]``: served from the cache
+  immediately while a background refresh runs;
+- otherwise fetched synchronously. If that fetch fails, the last good value
+  is served regardless of age.
+
+Synchronous interactive fetches made of a single upstream request are
+hedged: if the request has not returned ``settings.HEDGE_AFTER`` seconds
+after it started, a second one is issued and whichever finishes first wins.
+The clock starts only once the request holds its rate-limit token and a fetch
+worker, so time spent queueing never triggers a duplicate. The duplicate is
+only sent when a token and a worker are free right away. Batch and background
+fetches are never hedged.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+import requests
+import yfinance as yf
+
+from stock_research.config.settings import settings
+from stock_research.data.cache import cache
+from stock_research.data.ratelimit import BATCH, INTERACTIVE, rate_limiter
+
+logger = logging.getLogger(__name__)
+
+_FETCH_WORKERS = 8
+_fetch_pool = ThreadPoolExecutor(max_workers=_FETCH_WORKERS, thread_name_prefix="market-fetch")
+# Held by every running hedged request, so a queued request is never timed
+_fetch_slots = threading.BoundedSemaphore(_FETCH_WORKERS)
+_revalidate_pool = ThreadPoolExecutor(
+    max_workers=settings.REVALIDATE_WORKERS, thread_name_prefix="market-revalidate"
+)
+_revalidating: set = set()
+_revalidating_lock = threading.Lock()
+
+
+def _start(request: Callable[[], Any]) -> Future:
+    """Run ``request`` on a fetch worker; the caller already holds a fetch slot."""
+    def run() -> Any:
+        try:
+            return request()
+        finally:
+            _fetch_slots.release()
+
+    return _fetch_pool.submit(run)
+
+
+def _hedged(request: Callable[[], Any], host: str) -> Any:
+    """Run one interactive upstream request, issuing a duplicate if it is slow."""
+    rate_limiter.acquire(host, INTERACTIVE)
+    _fetch_slots.acquire()
+    first = _start(request)
+    try:
+        return first.result(timeout=settings.HEDGE_AFTER)
+    except FuturesTimeout:
+        pass
+
+    # Never queue for the duplicate: under contention it would only add load
+    if not _fetch_slots.acquire(blocking=False):
+        return first.result()
+    if not rate_limiter.try_acquire(host, INTERACTIVE):
+        _fetch_slots.release()
+        return first.result()
+
+    second = _start(request)
+    pending = {first, second}
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+    raise error
+
+
+def _store(kind: str, key: str, value: Any) -> None:
+    """Cache a fetched value unless it is empty."""
+    if value is None or (isinstance(value, pd.DataFrame) and len(value) == 0):
+        return
+    cache.set(kind, key, value)
+
+
+def _revalidate(kind: str, key: str, fetch: Callable[[int], Any]) -> None:
+    """Refresh a cache entry in the background, once per entry at a time."""
+    with _revalidating_lock:
+        if (kind, key) in _revalidating:
+            return
+        _revalidating.add((kind, key))
+
+    def run() -> None:
+        try:
+            _store(kind, key, fetch(BATCH))
+        except Exception as e:
+            logger.warning("Background refresh of %s %s failed: %s", kind, key, e)
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard((kind, key))
+
+    _revalidate_pool.submit(run)
+
+
+def _serve(
+    kind: str,
+    key: str,
+    fetch: Callable[[int], Any],
+    priority: int,
+    refresh: bool,
+    request: Optional[Callable[[], Any]] = None,
+    host: str = "yahoo",
+) -> Any:
+    """Serve a value according to the stale-while-revalidate policy.
+
+    ``fetch(priority)`` takes its own rate-limit tokens. ``request`` is the
+    bare upstream call for fetches made of a single request, which are hedged
+    for interactive callers; fetches made of many requests are not, as a
+    duplicate would only compete with the original for tokens.
+    """
+    entry = cache.get_entry(kind, key)
+    if entry is not None and not refresh:
+        value, stored_at = entry
+        age = time.time() - stored_at
+        if age <= settings.FRESHNESS.get(kind, settings.CACHE_TTL):
+            return value
+        if age <= settings.MAX_STALENESS.get(kind, settings.CACHE_TTL):
+            _revalidate(kind, key, fetch)
+            return value
+
+    try:
+        if request is not None and priority == INTERACTIVE:
+            value = _hedged(request, host)
+        else:
+            value = fetch(priority)
+    except Exception:
+        if entry is None:
+            raise
+        logger.warning("Fetching %s %s failed, serving last good value", kind, key, exc_info=True)
+        return entry[0]
+
+    _store(kind, key, value)
+    return value
+
+
+def _serve_request(
+    kind: str,
+    key: str,
+    request: Callable[[], Any],
+    priority: int,
+    refresh: bool,
+    host: str = "yahoo",
+) -> Any:
+    """Serve a value fetched with a single upstream request."""
+    def fetch(fetch_priority: int) -> Any:
+        rate_limiter.acquire(host, fetch_priority)
+        return request()
+
+    return _serve(kind, key, fetch, priority, refresh, request=request, host=host)
+
+
+def fetched_at(kind: str, key: str) -> Optional[float]:
+    """Return when the cached value was fetched, as a Unix timestamp."""
+    entry = cache.get_entry(kind, key)
+    return None if entry is None else entry[1]
+
+
+def data_age(kind: str, key: str) -> Optional[float]:
+    """Return the age of the cached value in seconds, or None if missing."""
+    return cache.age(kind, key)
+
+
+def format_age(seconds: Optional[float]) -> str:
+    """Describe a data age for display."""
+    if seconds is None:
+        return "not cached"
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    if seconds < 86400:
+        return f"{seconds / 3600:.1f} h ago"
+    return f"{seconds / 86400:.1f} days ago"
+
+
+def history_key(ticker: str, period: Optional[str] = None) -> str:
+    """Cache key of a ticker's price history."""
+    return f"{ticker}:{period or settings.HISTORY_PERIOD}"
+
+
+def get_info(ticker: str, priority: int = INTERACTIVE, refresh: bool = False) -> Dict[str, Any]:
+    """Return the ``.info`` dict for a ticker."""
+    return _serve_request("info", ticker, lambda: yf.Ticker(ticker).info, priority, refresh)
+
+
+def get_history(
+    ticker: str,
+    period: Optional[str] = None,
+    priority: int = INTERACTIVE,
+    refresh: bool = False,
+) -> pd.DataFrame:
+    """Return daily OHLCV history for a ticker, ``settings.HISTORY_PERIOD`` by default."""
+    period = period or settings.HISTORY_PERIOD
+
+    def request() -> pd.DataFrame:
+        return yf.Ticker(ticker).history(period=period)
+
+    return _serve_request("history", history_key(ticker, period), request, priority, refresh)
+
+
+STATEMENTS = {
+    "income": "quarterly_income_stmt",
+    "balance": "quarterly_balance_sheet",
+    "cashflow": "quarterly_cashflow",
+}
+
+
+def _merge_periods(stored: Optional[pd.DataFrame], fetched: pd.DataFrame) -> pd.DataFrame:
+    """Merge a fetched statement (items x periods) into the stored one (periods x items).
+
+    Yahoo only returns the latest few quarters, so older stored periods are
+    kept and the history grows with every fetch. Fetched values win.
+    """
+    fetched = fetched.T if fetched is not None else pd.DataFrame()
+    if len(fetched) > 0:
+        fetched.index = pd.to_datetime(fetched.index)
+    if stored is None or len(stored) == 0:
+        return fetched.sort_index()
+    if len(fetched) == 0:
+        return stored
+    return fetched.combine_first(stored).sort_index()
+
+
+def get_statements(
+    ticker: str,
+    priority: int = INTERACTIVE,
+    refresh: bool = False,
+) -> Dict[str, pd.DataFrame]:
+    """Return quarterly income, balance-sheet and cash-flow statements, periods as rows."""
+    def fetch(fetch_priority: int) -> Dict[str, pd.DataFrame]:
+        entry = cache.get_entry("statements", ticker)
+        stored = entry[0] if entry is not None else {}
+        stock = yf.Ticker(ticker)
+        merged = {}
+        for name, attribute in STATEMENTS.items():
+            rate_limiter.acquire("yahoo", fetch_priority)
+            merged[name] = _merge_periods(stored.get(name), getattr(stock, attribute))
+        return merged
+
+    return _serve("statements", ticker, fetch, priority, refresh)
+
+
+def get_news(ticker: str, priority: int = INTERACTIVE, refresh: bool = False) -> List[Dict[str, Any]]:
+    """Return the raw news items for a ticker."""
+    def request() -> List[Dict[str, Any]]:
+        return yf.Ticker(ticker).news or []
+
+    return _serve_request("news", ticker, request, priority, refresh)
+
+
+OPTION_COLUMNS = [
+    "contractSymbol", "strike", "lastPrice", "bid", "ask",
+    "volume", "openInterest", "impliedVolatility",
+]
+
+
+def get_option_chains(ticker: str, priority: int = INTERACTIVE, refresh: bool = False) -> pd.DataFrame:
+    """Return the calls and puts of every listed expiry as one frame.
+
+    Columns are ``expiry`` and ``type`` (``"call"``/``"put"``) followed by
+    ``OPTION_COLUMNS`` and ``underlyingPrice``, the underlying's regular
+    market price quoted in the same response as each expiry's contracts.
+    All expiries are fetched and cached together.
+    """
+    def fetch(fetch_priority: int) -> pd.DataFrame:
+        stock = yf.Ticker(ticker)
+        rate_limiter.acquire("yahoo", fetch_priority)
+        frames = []
+        for expiry in stock.options:
+            rate_limiter.acquire("yahoo", fetch_priority)
+            chain = stock.option_chain(expiry)
+            underlying = getattr(chain, "underlying", None) or {}
+            for kind, contracts in (("call", chain.calls), ("put", chain.puts)):
+                if contracts is None or len(contracts) == 0:
+                    continue
+                frame = contracts.reindex(columns=OPTION_COLUMNS)
+                frame.insert(0, "type", kind)
+                frame.insert(0, "expiry", pd.Timestamp(expiry))
+                frame["underlyingPrice"] = underlying.get("regularMarketPrice", float("nan"))
+                frames.append(frame)
+        if not frames:
+            return pd.DataFrame(columns=["expiry", "type"] + OPTION_COLUMNS + ["underlyingPrice"])
+        return pd.concat(frames, ignore_index=True)
+
+    return _serve("options", ticker, fetch, priority, refresh)
+
+
+STOCKTWITS_URL = "https://api.stocktwits.com/api/2/streams/symbol/{symbol}.json"
+
+
+def get_stocktwits(symbol: str, priority: int = INTERACTIVE, refresh: bool = False) -> List[Dict[str, Any]]:
+    """Return the latest StockTwits messages for a symbol."""
+    def request() -> List[Dict[str, Any]]:
+        response = requests.get(STOCKTWITS_URL.format(symbol=symbol), timeout=settings.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json().get("messages", [])
+
+    return _serve_request("stocktwits", symbol, request, priority, refresh, host="stocktwits")
@@ -0,0 +1,219 @@
+"""Host-wide token-bucket rate limiter shared by all worker processes.
+
+Bucket state lives in a SQLite database under ``settings.CACHE_DIR`` so every
+Streamlit worker (and batch job) on the machine draws from the same budget per
+upstream host. Interactive requests take priority over batch requests: batch
+callers may not dip into the reserved share of the burst and yield while an
+interactive caller is waiting. Queue-wait metrics are kept in the same
+database, so they cover every process sharing the budget.
+"""
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from stock_research.config.settings import settings
+
+INTERACTIVE = 0
+BATCH = 1
+
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BATCH: "batch"}
+
+# Seconds a waiting interactive caller stays registered past its expected wait
+_WAITER_GRACE = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    host TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS waiters (
+    id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    expires REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    host TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    requests INTEGER NOT NULL,
+    timeouts INTEGER NOT NULL,
+    total_wait REAL NOT NULL,
+    max_wait REAL NOT NULL,
+    PRIMARY KEY (host, priority)
+);
+"""
+
+
+class RateLimitTimeout(TimeoutError):
+    """Raised when a token could not be acquired within the timeout."""
+
+
+class HostRateLimiter:
+    """Token bucket per upstream host, backed by a shared SQLite file."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        limits: Optional[Dict[str, tuple]] = None,
+        batch_reserve: Optional[float] = None,
+    ):
+        self.db_path = Path(db_path or settings.RATE_LIMIT_DB)
+        self.limits = dict(limits or settings.RATE_LIMITS)
+        self.batch_reserve = (
+            settings.RATE_LIMIT_BATCH_RESERVE if batch_reserve is None else batch_reserve
+        )
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, creating the database on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _try_take(
+        self,
+        conn: sqlite3.Connection,
+        host: str,
+        priority: int,
+        waiter_id: str,
+        queue: bool = True,
+    ) -> float:
+        """Take a token if allowed. Returns 0 on success, else seconds to wait.
+
+        With ``queue=False`` an interactive caller is not registered as a waiter.
+        """
+        rate, burst = self.limits[host]
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE host = ?", (host,)
+            ).fetchone()
+            tokens = float(burst) if row is None else min(
+                float(burst), row[0] + (now - row[1]) * rate
+            )
+
+            # Batch callers leave the reserve alone, but can always use a full bucket
+            floor = 0.0
+            waiter_expires = None
+            if priority != INTERACTIVE:
+                floor = min(burst * self.batch_reserve, burst - 1.0)
+                waiter_expires = conn.execute(
+                    "SELECT MAX(expires) FROM waiters WHERE host = ? AND priority < ? AND expires > ?",
+                    (host, priority, now),
+                ).fetchone()[0]
+
+            if waiter_expires is None and tokens - 1.0 >= floor:
+                tokens -= 1.0
+                wait = 0.0
+            else:
+                wait = max((floor + 1.0 - tokens) / rate, 0.01)
+                if waiter_expires is not None:
+                    # Yield until the interactive waiter is expected to be served
+                    wait = max(wait, waiter_expires - _WAITER_GRACE - now)
+                if priority == INTERACTIVE and queue:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO waiters (id, host, priority, expires) VALUES (?, ?, ?, ?)",
+                        (waiter_id, host, priority, now + wait + _WAITER_GRACE),
+                    )
+
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (host, tokens, updated) VALUES (?, ?, ?)",
+                (host, tokens, now),
+            )
+            if wait == 0.0:
+                conn.execute("DELETE FROM waiters WHERE id = ? OR expires <= ?", (waiter_id, now))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return wait
+
+    def acquire(
+        self,
+        host: str,
+        priority: int = INTERACTIVE,
+        timeout: Optional[float] = None,
+    ) -> float:
+        """Block until a token for ``host`` is available. Returns seconds waited."""
+        if host not in self.limits:
+            return 0.0
+
+        timeout = settings.RATE_LIMIT_TIMEOUT if timeout is None else timeout
+        conn = self._connect()
+        waiter_id = f"{os.getpid()}:{threading.get_ident()}"
+        start = time.monotonic()
+
+        while True:
+            wait = self._try_take(conn, host, priority, waiter_id)
+            waited = time.monotonic() - start
+            if wait == 0.0:
+                self._record(conn, host, priority, waited)
+                return waited
+            if waited + wait > timeout:
+                conn.execute("DELETE FROM waiters WHERE id = ?", (waiter_id,))
+                self._record(conn, host, priority, waited, timed_out=True)
+                raise RateLimitTimeout(f"Rate limit for {host} not available within {timeout:.1f}s")
+            time.sleep(min(wait, 0.5))
+
+    def try_acquire(self, host: str, priority: int = INTERACTIVE) -> bool:
+        """Take a token for ``host`` only if one is available right now."""
+        if host not in self.limits:
+            return True
+        conn = self._connect()
+        waiter_id = f"{os.getpid()}:{threading.get_ident()}"
+        if self._try_take(conn, host, priority, waiter_id, queue=False) > 0.0:
+            return False
+        self._record(conn, host, priority, 0.0)
+        return True
+
+    def _record(
+        self,
+        conn: sqlite3.Connection,
+        host: str,
+        priority: int,
+        waited: float,
+        timed_out: bool = False,
+    ) -> None:
+        """Add one acquisition to the shared queue wait metrics."""
+        conn.execute(
+            """
+            INSERT INTO metrics (host, priority, requests, timeouts, total_wait, max_wait)
+            VALUES (?, ?, 1, ?, ?, ?)
+            ON CONFLICT (host, priority) DO UPDATE SET
+                requests = requests + 1,
+                timeouts = timeouts + excluded.timeouts,
+                total_wait = total_wait + excluded.total_wait,
+                max_wait = MAX(max_wait, excluded.max_wait)
+            """,
+            (host, PRIORITY_NAMES.get(priority, str(priority)), int(timed_out), waited, waited),
+        )
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Return queue wait metrics per ``host/priority`` across all processes."""
+        rows = self._connect().execute(
+            "SELECT host, priority, requests, timeouts, total_wait, max_wait FROM metrics ORDER BY host, priority"
+        ).fetchall()
+        return {
+            f"{host}/{priority}": {
+                "requests": requests,
+                "timeouts": timeouts,
+                "total_wait": total_wait,
+                "max_wait": max_wait,
+                "avg_wait": total_wait / requests if requests else 0.0,
+            }
+            for host, priority, requests, timeouts, total_wait, max_wait in rows
+        }
+
+
+# Shared limiter instance
+rate_limiter = HostRateLimiter()
@@ -0,0 +1,58 @@
+"""Ticker usage tracking shared across worker processes."""
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from stock_research.config.settings import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    ticker TEXT NOT NULL,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS usage_ts ON usage (ts);
+"""
+
+
+@contextmanager
+def _connect(db_path: Optional[Path] = None) -> Iterator[sqlite3.Connection]:
+    """Open the usage database in a committed, closed-on-exit transaction."""
+    path = Path(db_path or settings.USAGE_DB)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=10.0)
+    try:
+        conn.executescript(_SCHEMA)
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def record_usage(ticker: str) -> None:
+    """Record that a user opened a ticker."""
+    with _connect() as conn:
+        conn.execute("INSERT INTO usage (ticker, ts) VALUES (?, ?)", (ticker.upper(), time.time()))
+        conn.execute(
+            "DELETE FROM usage WHERE ts < ?",
+            (time.time() - settings.USAGE_WINDOW_DAYS * 86400,),
+        )
+
+
+def rank_tickers(tickers: Iterable[str]) -> List[str]:
+    """Order tickers by recent usage frequency, most used first."""
+    tickers = [t.upper() for t in tickers]
+    since = time.time() - settings.USAGE_WINDOW_DAYS * 86400
+    with _connect() as conn:
+        counts = dict(conn.execute(
+            "SELECT ticker, COUNT(*) FROM usage WHERE ts >= ? GROUP BY ticker", (since,)
+        ).fetchall())
+    return sorted(tickers, key=lambda t: -counts.get(t, 0))
+
+
+def seconds_since_last_use() -> Optional[float]:
+    """Return seconds since any ticker was last opened, or None if never."""
+    with _connect() as conn:
+        (last,) = conn.execute("SELECT MAX(ts) FROM usage").fetchone()
+    return None if last is None else time.time() - last
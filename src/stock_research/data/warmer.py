@@ -0,0 +1,111 @@
+"""Pre-market cache warmer and precompute scheduler.
+
+Run as ``python -m stock_research.data.warmer``. Before the session opens, and
+during the session whenever no analyst has opened a ticker for a while, it
+refreshes fundamentals,
+indicator frames, signals and scored news for the watchlist, most-used tickers
+first. All upstream calls use batch priority in the shared rate limiter and at
+most ``settings.WARMER_CONCURRENCY`` tickers are warmed at once, so interactive
+users keep the bulk of the upstream budget.
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import time as dt_time
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from stock_research.config.settings import settings
+from stock_research.data import loaders, market, usage
+from stock_research.data.ratelimit import BATCH
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_time(value: str) -> dt_time:
+    """Parse an ``HH:MM`` string."""
+    hour, minute = value.split(":")
+    return dt_time(int(hour), int(minute))
+
+
+def is_premarket(now: Optional[datetime] = None) -> bool:
+    """Return True during the configured pre-market window on weekdays."""
+    now = now or datetime.now(ZoneInfo(settings.MARKET_TIMEZONE))
+    if now.weekday() >= 5:
+        return False
+    start = _parse_time(settings.WARMER_PREMARKET_START)
+    end = _parse_time(settings.MARKET_OPEN)
+    return start <= now.time() < end
+
+
+def is_session(now: Optional[datetime] = None) -> bool:
+    """Return True between the market open and close on weekdays."""
+    now = now or datetime.now(ZoneInfo(settings.MARKET_TIMEZONE))
+    if now.weekday() >= 5:
+        return False
+    return _parse_time(settings.MARKET_OPEN) <= now.time() < _parse_time(settings.MARKET_CLOSE)
+
+
+def is_quiet() -> bool:
+    """Return True when no ticker has been opened for the configured quiet period."""
+    idle = usage.seconds_since_last_use()
+    return idle is None or idle >= settings.WARMER_QUIET_MINUTES * 60
+
+
+def should_warm(now: Optional[datetime] = None) -> bool:
+    """Return True before the open, or during a quiet period of the session."""
+    now = now or datetime.now(ZoneInfo(settings.MARKET_TIMEZONE))
+    return is_premarket(now) or (is_session(now) and is_quiet())
+
+
+def warm_ticker(ticker: str) -> None:
+    """Refresh every cached fetch and precomputed analysis for one ticker."""
+    market.get_info(ticker, priority=BATCH, refresh=True)
+    # Statements change quarterly; refetch them only once FRESHNESS["statements"] has passed
+    loaders.load_ratios(ticker, priority=BATCH)
+    loaders.load_technical(ticker, priority=BATCH, refresh=True)
+    for timeframe in settings.TIMEFRAMES:
+        loaders.load_timeframe(ticker, timeframe, priority=BATCH)
+    loaders.load_risk([ticker], priority=BATCH)
+    loaders.load_scored_news(ticker, priority=BATCH, refresh=True)
+
+
+def run_once(watchlist: Optional[List[str]] = None) -> Dict[str, Optional[str]]:
+    """Warm the watchlist once. Returns ``{ticker: error or None}``."""
+    tickers = usage.rank_tickers(watchlist or settings.WATCHLIST)
+    results: Dict[str, Optional[str]] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, settings.WARMER_CONCURRENCY)) as pool:
+        futures = {ticker: pool.submit(warm_ticker, ticker) for ticker in tickers}
+        for ticker, future in futures.items():
+            try:
+                future.result()
+                results[ticker] = None
+            except Exception as e:
+                logger.warning("Failed to warm %s: %s", ticker, e)
+                results[ticker] = str(e)
+
+    return results
+
+
+def run_forever(poll_seconds: int = 60) -> None:
+    """Warm the cache whenever the schedule allows it."""
+    last_run = 0.0
+    while True:
+        due = time.time() - last_run >= settings.WARMER_INTERVAL
+        if due and should_warm():
+            start = time.monotonic()
+            results = run_once()
+            failed = sum(1 for error in results.values() if error)
+            logger.info(
+                "Warmed %d tickers (%d failed) in %.1fs",
+                len(results), failed, time.monotonic() - start,
+            )
+            last_run = time.time()
+        time.sleep(poll_seconds)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_forever()
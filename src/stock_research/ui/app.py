@@ -3,7 +3,8 @@ import streamlit as st
 from pathlib import Path
 
 from stock_research.config.settings import settings
-from stock_research.ui.components import fundamental, technical, sentiment
+from stock_research.data.usage import record_usage
+from stock_research.ui.components import fundamental, technical, sentiment, options
 
 def setup_page():
     """Configure Streamlit page settings."""
@@ -100,11 +101,18 @@ def main():
             st.error("Please enter a stock ticker")
             return
         
+        record_usage(ticker)
+        # Keep the analysis open across reruns triggered by widgets in the tabs
+        st.session_state["active_ticker"] = ticker
+    
+    ticker = st.session_state.get("active_ticker")
+    if ticker:
         # Create tabs with better styling
-        tab1, tab2, tab3 = st.tabs([
+        tab1, tab2, tab3, tab4 = st.tabs([
             "📊 Fundamental Analysis",
             "📈 Technical Analysis",
-            "📰 Sentiment Analysis"
+            "📰 Sentiment Analysis",
+            "🧮 Options Analysis"
         ])
         
         with tab1:
@@ -121,6 +129,11 @@ def main():
             st.markdown('<div class="analysis-section">', unsafe_allow_html=True)
             sentiment.render_analysis(ticker)
             st.markdown('</div>', unsafe_allow_html=True)
+        
+        with tab4:
+            st.markdown('<div class="analysis-section">', unsafe_allow_html=True)
+            options.render_analysis(ticker)
+            st.markdown('</div>', unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,5 @@
 """UI components for the stock research application."""
 
-from . import fundamental, technical, sentiment
+from . import fundamental, technical, sentiment, options
 
-__all__ = ["fundamental", "technical", "sentiment"]
\ No newline at end of file
+__all__ = ["fundamental", "technical", "sentiment", "options"]
\ No newline at end of file
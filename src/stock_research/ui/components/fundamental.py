@@ -1,9 +1,10 @@
 """Fundamental analysis component."""
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import plotly.graph_objects as go
 
+from stock_research.data import loaders, market
+
 def format_large_number(number: float) -> str:
     """Format large numbers into billions/millions."""
     if number >= 1e9:
@@ -13,12 +14,68 @@ def format_large_number(number: float) -> str:
     else:
         return f"${number:,.2f}"
 
+TREND_METRICS = {
+    'Revenue (TTM)': 'money',
+    'Revenue Growth (YoY)': 'percent',
+    'Gross Margin': 'percent',
+    'Operating Margin': 'percent',
+    'Net Margin': 'percent',
+    'FCF Margin': 'percent',
+    'ROE': 'percent',
+    'Debt/Equity': 'ratio',
+}
+
+def format_trend_value(value: float, kind: str) -> str:
+    """Format the latest value of a trend metric."""
+    if kind == 'money':
+        return format_large_number(value)
+    if kind == 'percent':
+        return f"{value * 100:.2f}%"
+    return f"{value:.2f}"
+
+def render_trends(ticker: str) -> None:
+    """Render TTM ratio sparklines from the cached statement history."""
+    ratios = loaders.load_ratios(ticker)
+    
+    st.markdown("<h2 class='section-title'>📉 Financial Trends (TTM)</h2>", unsafe_allow_html=True)
+    if len(ratios) == 0:
+        st.info("No quarterly statements available.")
+        return
+    
+    age = market.data_age("statements", ticker)
+    st.caption(f"Statements updated {market.format_age(age)}")
+    
+    metrics = [(name, kind) for name, kind in TREND_METRICS.items() if ratios[name].notna().any()]
+    for start in range(0, len(metrics), 4):
+        cols = st.columns(4)
+        for col, (name, kind) in zip(cols, metrics[start:start + 4]):
+            series = ratios[name].dropna()
+            with col:
+                st.metric(name, format_trend_value(series.iloc[-1], kind))
+                fig = go.Figure(go.Scatter(
+                    x=series.index,
+                    y=series.values,
+                    mode='lines+markers',
+                    line=dict(color='#1e3a8a', width=2),
+                    marker=dict(size=4),
+                    hovertemplate="%{x|%b %Y}: %{y:.3g}<extra></extra>"
+                ))
+                fig.update_layout(
+                    height=100,
+                    margin=dict(l=0, r=0, t=0, b=0),
+                    xaxis=dict(visible=False),
+                    yaxis=dict(visible=False),
+                    showlegend=False
+                )
+                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+
 def render_analysis(ticker: str) -> None:
     """Render fundamental analysis for a stock."""
     try:
         # Get stock data
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = market.get_info(ticker)
+        age = market.data_age("info", ticker)
+        st.caption(f"Fundamental data updated {market.format_age(age)}")
 
         # Custom styling
         st.markdown("""
@@ -153,6 +210,9 @@ def render_analysis(ticker: str) -> None:
             )
         st.markdown('</div>', unsafe_allow_html=True)
 
+        # Financial Trends Section
+        render_trends(ticker)
+
     except Exception as e:
         st.error(f"Error analyzing fundamentals for {ticker}: {str(e)}")
         st.info("Please try again or choose a different stock.")
\ No newline at end of file
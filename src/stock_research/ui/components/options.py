@@ -0,0 +1,104 @@
+"""Options analysis component."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from stock_research.analysis.options import iv_surface
+from stock_research.config.settings import settings
+from stock_research.data import loaders, market
+
+GREEK_COLUMNS = ['strike', 'type', 'bid', 'ask', 'mid', 'volume', 'openInterest',
+                 'iv', 'delta', 'gamma', 'vega', 'theta']
+
+def plot_iv_surface(chain: pd.DataFrame) -> go.Figure:
+    """Create a 3D implied-volatility surface over moneyness and days to expiry."""
+    low, high = settings.OPTIONS_MONEYNESS_RANGE
+    surface = iv_surface(chain, np.linspace(low, high, 41))
+    
+    fig = go.Figure(go.Surface(
+        x=surface.columns * 100,
+        y=surface.index,
+        z=surface.values * 100,
+        colorscale='Viridis',
+        colorbar=dict(title='IV %'),
+        hovertemplate="Moneyness %{x:.0f}%<br>%{y:.0f} days<br>IV %{z:.1f}%<extra></extra>"
+    ))
+    fig.update_layout(
+        height=600,
+        scene=dict(
+            xaxis_title='Strike / Spot (%)',
+            yaxis_title='Days to Expiry',
+            zaxis_title='Implied Volatility (%)'
+        ),
+        margin=dict(l=0, r=0, t=30, b=0)
+    )
+    return fig
+
+def plot_skew(contracts: pd.DataFrame, spot: float) -> go.Figure:
+    """Create an implied-volatility skew chart for one expiry."""
+    fig = go.Figure()
+    for kind, color in [('call', 'green'), ('put', 'red')]:
+        side = contracts[(contracts['type'] == kind) & contracts['iv'].notna()].sort_values('strike')
+        fig.add_trace(go.Scatter(
+            x=side['strike'],
+            y=side['iv'] * 100,
+            name=f"{kind.title()}s",
+            mode='lines+markers',
+            line=dict(color=color, width=1),
+            marker=dict(size=4)
+        ))
+    fig.add_vline(x=spot, line_dash="dash", line_color="gray", annotation_text="Spot")
+    fig.update_layout(
+        height=400,
+        xaxis_title='Strike',
+        yaxis_title='Implied Volatility (%)',
+        hovermode='x unified'
+    )
+    return fig
+
+def render_analysis(ticker: str) -> None:
+    """Render options analysis for a stock."""
+    st.header(f"Options Analysis for {ticker}")
+    
+    try:
+        chain, spot = loaders.load_options(ticker)
+        
+        if len(chain) == 0:
+            st.warning(f"No listed options found for {ticker}")
+            return
+        if spot is None:
+            st.warning(f"No underlying price was quoted with the option chains for {ticker}")
+            return
+        
+        age = market.data_age("options", ticker)
+        st.caption(
+            f"Option chains updated {market.format_age(age)} · "
+            f"{len(chain):,} contracts across {chain['expiry'].nunique()} expiries · spot ${spot:.2f}"
+        )
+        
+        # Implied volatility surface
+        st.subheader("Implied Volatility Surface")
+        st.plotly_chart(plot_iv_surface(chain), use_container_width=True)
+        
+        # Skew and Greeks for one expiry
+        expiries = sorted(chain.loc[chain['days'] > 0, 'expiry'].unique())
+        expiry = st.selectbox(
+            "Expiry",
+            expiries,
+            format_func=lambda e: pd.Timestamp(e).strftime('%Y-%m-%d')
+        )
+        contracts = chain[chain['expiry'] == expiry]
+        
+        st.subheader("Volatility Skew")
+        st.plotly_chart(plot_skew(contracts, spot), use_container_width=True)
+        
+        st.subheader("Greeks")
+        table = contracts[GREEK_COLUMNS].sort_values(['type', 'strike']).copy()
+        table['iv'] = table['iv'] * 100
+        table = table.rename(columns={'iv': 'IV %', 'openInterest': 'open interest'})
+        st.dataframe(table.round(4), use_container_width=True, hide_index=True)
+        
+    except Exception as e:
+        st.error(f"Error analyzing options for {ticker}: {str(e)}")
+        st.info("Please try again or choose a different stock.")
@@ -1,71 +1,41 @@
 """Sentiment analysis component with social media integration."""
 import streamlit as st
-import yfinance as yf
 from datetime import datetime, timedelta
 import pandas as pd
 import plotly.graph_objects as go
-import requests
 from plotly.subplots import make_subplots
 
-def calculate_sentiment(text: str) -> int:
-    """Calculate a simple sentiment score based on keywords."""
-    if not isinstance(text, str):
-        return 0
-        
-    positive_words = ['rise', 'gain', 'up', 'surge', 'jump', 'boost', 'positive', 'strong', 'success', 'bullish']
-    negative_words = ['fall', 'drop', 'down', 'decline', 'weak', 'negative', 'loss', 'risk', 'concern', 'bearish']
-    
-    text = text.lower()
-    positive_count = sum(1 for word in positive_words if word in text)
-    negative_count = sum(1 for word in negative_words if word in text)
-    
-    return positive_count - negative_count
-
-def parse_news_date(date_str: str) -> datetime:
-    """Parse date string to datetime object."""
-    try:
-        return datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%SZ')
-    except ValueError:
-        try:
-            return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-        except ValueError:
-            return datetime.now()
+from stock_research.analysis.sentiment import summarize_news
+from stock_research.data import loaders, market
 
 def get_stocktwits_sentiment(symbol: str) -> dict:
-    """Fetch sentiment data from StockTwits API."""
+    """Summarize cached StockTwits sentiment for a symbol."""
     try:
-        url = f"https://api.stocktwits.com/api/2/streams/symbol/{symbol}.json"
-        response = requests.get(url)
+        messages = market.get_stocktwits(symbol)
         
-        if response.status_code == 200:
-            data = response.json()
-            messages = data.get('messages', [])
-            
-            sentiment_counts = {
-                'bullish': 0,
-                'bearish': 0,
-                'neutral': 0
-            }
-            
-            recent_messages = []
-            for msg in messages:
-                sentiment = msg.get('entities', {}).get('sentiment', {}).get('basic', 'neutral')
-                sentiment_counts[sentiment] += 1
-                
-                recent_messages.append({
-                    'message': msg.get('body', ''),
-                    'created_at': msg.get('created_at', ''),
-                    'user': msg.get('user', {}).get('username', ''),
-                    'sentiment': sentiment
-                })
+        sentiment_counts = {
+            'bullish': 0,
+            'bearish': 0,
+            'neutral': 0
+        }
+        
+        recent_messages = []
+        for msg in messages:
+            sentiment = ((msg.get('entities') or {}).get('sentiment') or {}).get('basic', 'neutral').lower()
+            sentiment_counts[sentiment if sentiment in sentiment_counts else 'neutral'] += 1
             
-            return {
-                'sentiment_counts': sentiment_counts,
-                'recent_messages': recent_messages[:10],
-                'total_messages': len(messages)
-            }
+            recent_messages.append({
+                'message': msg.get('body', ''),
+                'created_at': msg.get('created_at', ''),
+                'user': msg.get('user', {}).get('username', ''),
+                'sentiment': sentiment
+            })
         
-        return None
+        return {
+            'sentiment_counts': sentiment_counts,
+            'recent_messages': recent_messages[:10],
+            'total_messages': len(messages)
+        }
     except Exception as e:
         st.error(f"Error fetching StockTwits data: {str(e)}")
         return None
@@ -73,55 +43,24 @@ def get_stocktwits_sentiment(symbol: str) -> dict:
 def render_news_sentiment(ticker: str):
     """Render news sentiment analysis."""
     try:
-        stock = yf.Ticker(ticker)
-        news = stock.news
+        news, processed_news = loaders.load_scored_news(ticker)
+        
+        age = market.data_age("news", ticker)
+        st.caption(f"News updated {market.format_age(age)}")
         
         if not news:
             st.warning(f"No recent news found for {ticker}")
             return
 
-        processed_news = []
-        for item in news:
-            try:
-                if 'content' in item:
-                    content = item['content']
-                    title = content.get('title', '')
-                    summary = content.get('summary', '')
-                    date = content.get('pubDate', '')
-                    url = content.get('previewUrl', '')
-                else:
-                    title = item.get('title', '')
-                    summary = item.get('summary', '')
-                    date = item.get('pubDate', '')
-                    url = item.get('previewUrl', '')
-
-                sentiment_score = calculate_sentiment(title) + calculate_sentiment(summary)
-                sentiment_category = (
-                    'positive' if sentiment_score > 0
-                    else 'negative' if sentiment_score < 0
-                    else 'neutral'
-                )
-
-                news_item = {
-                    'title': title,
-                    'summary': summary,
-                    'date': parse_news_date(date) if date else datetime.now(),
-                    'url': url,
-                    'sentiment_score': sentiment_score,
-                    'sentiment_category': sentiment_category
-                }
-                processed_news.append(news_item)
-            except Exception as e:
-                continue
-
         if processed_news:
             # Sentiment Overview
             st.subheader("📊 News Sentiment Overview")
             
-            total_news = len(processed_news)
-            positive_news = sum(1 for item in processed_news if item['sentiment_category'] == 'positive')
-            negative_news = sum(1 for item in processed_news if item['sentiment_category'] == 'negative')
-            neutral_news = sum(1 for item in processed_news if item['sentiment_category'] == 'neutral')
+            summary = summarize_news(processed_news)
+            total_news = summary['total']
+            positive_news = summary['positive']
+            negative_news = summary['negative']
+            neutral_news = summary['neutral']
 
             col1, col2, col3, col4 = st.columns(4)
             with col1:
@@ -195,6 +134,9 @@ def render_social_sentiment(ticker: str):
     
     stocktwits_data = get_stocktwits_sentiment(ticker)
     
+    age = market.data_age("stocktwits", ticker)
+    st.caption(f"StockTwits updated {market.format_age(age)}")
+    
     if stocktwits_data:
         # Social Sentiment Overview
         st.markdown('<div class="sentiment-section">', unsafe_allow_html=True)
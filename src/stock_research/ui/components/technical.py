@@ -1,46 +1,27 @@
 """Technical analysis component."""
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
+from typing import Dict, Optional
 
-def calculate_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    """Calculate technical indicators for the given dataframe."""
-    # Calculate moving averages
-    df['SMA20'] = df['Close'].rolling(window=20).mean()
-    df['SMA50'] = df['Close'].rolling(window=50).mean()
-    df['SMA200'] = df['Close'].rolling(window=200).mean()
-    
-    # Calculate RSI
-    delta = df['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    df['RSI'] = 100 - (100 / (1 + rs))
-    
-    # Calculate MACD
-    exp1 = df['Close'].ewm(span=12, adjust=False).mean()
-    exp2 = df['Close'].ewm(span=26, adjust=False).mean()
-    df['MACD'] = exp1 - exp2
-    df['Signal_Line'] = df['MACD'].ewm(span=9, adjust=False).mean()
-    
-    # Calculate Bollinger Bands
-    df['BB_middle'] = df['Close'].rolling(window=20).mean()
-    df['BB_upper'] = df['BB_middle'] + 2*df['Close'].rolling(window=20).std()
-    df['BB_lower'] = df['BB_middle'] - 2*df['Close'].rolling(window=20).std()
-    
-    return df
+from stock_research.config.settings import settings
+from stock_research.data import loaders, market
 
-def plot_technical_chart(df: pd.DataFrame) -> go.Figure:
-    """Create technical analysis chart."""
+EXTRA_PANELS = ["Stochastic", "ADX", "ATR", "OBV"]
+
+def plot_technical_chart(df: pd.DataFrame, extra_panel: Optional[str] = "Stochastic") -> go.Figure:
+    """Create technical analysis chart, optionally with one of ``EXTRA_PANELS`` below MACD."""
+    rows = 4 if extra_panel else 3
+    row_heights = [0.5, 0.15, 0.15, 0.2] if extra_panel else [0.6, 0.2, 0.2]
+    
     # Create figure with secondary y-axis
-    fig = make_subplots(rows=3, cols=1, 
+    fig = make_subplots(rows=rows, cols=1, 
                        shared_xaxes=True,
                        vertical_spacing=0.05,
-                       row_heights=[0.6, 0.2, 0.2])
+                       row_heights=row_heights)
     
     # Add candlestick chart
     fig.add_trace(go.Candlestick(
@@ -90,6 +71,14 @@ def plot_technical_chart(df: pd.DataFrame) -> go.Figure:
         fill='tonexty'
     ), row=1, col=1)
     
+    # Add VWAP
+    fig.add_trace(go.Scatter(
+        x=df.index,
+        y=df['VWAP'],
+        name='VWAP (20)',
+        line=dict(color='teal', width=1, dash='dot')
+    ), row=1, col=1)
+    
     # Add RSI
     fig.add_trace(go.Scatter(
         x=df.index,
@@ -117,6 +106,29 @@ def plot_technical_chart(df: pd.DataFrame) -> go.Figure:
         line=dict(color='orange', width=1)
     ), row=3, col=1)
     
+    # Add the selected extra indicator panel
+    if extra_panel == "Stochastic":
+        fig.add_trace(go.Scatter(x=df.index, y=df['Stoch_K'], name='%K',
+                                 line=dict(color='blue', width=1)), row=4, col=1)
+        fig.add_trace(go.Scatter(x=df.index, y=df['Stoch_D'], name='%D',
+                                 line=dict(color='orange', width=1)), row=4, col=1)
+        fig.add_hline(y=80, line_dash="dash", line_color="red", row=4, col=1)
+        fig.add_hline(y=20, line_dash="dash", line_color="green", row=4, col=1)
+    elif extra_panel == "ADX":
+        fig.add_trace(go.Scatter(x=df.index, y=df['ADX'], name='ADX',
+                                 line=dict(color='black', width=1)), row=4, col=1)
+        fig.add_trace(go.Scatter(x=df.index, y=df['Plus_DI'], name='+DI',
+                                 line=dict(color='green', width=1)), row=4, col=1)
+        fig.add_trace(go.Scatter(x=df.index, y=df['Minus_DI'], name='-DI',
+                                 line=dict(color='red', width=1)), row=4, col=1)
+        fig.add_hline(y=25, line_dash="dash", line_color="gray", row=4, col=1)
+    elif extra_panel == "ATR":
+        fig.add_trace(go.Scatter(x=df.index, y=df['ATR'], name='ATR',
+                                 line=dict(color='brown', width=1)), row=4, col=1)
+    elif extra_panel == "OBV":
+        fig.add_trace(go.Scatter(x=df.index, y=df['OBV'], name='OBV',
+                                 line=dict(color='teal', width=1)), row=4, col=1)
+    
     # Update layout
     fig.update_layout(
         title='Technical Analysis Chart',
@@ -124,53 +136,125 @@ def plot_technical_chart(df: pd.DataFrame) -> go.Figure:
         yaxis2_title='RSI',
         yaxis3_title='MACD',
         xaxis_rangeslider_visible=False,
-        height=800
+        height=1000 if extra_panel else 800
     )
+    if extra_panel:
+        fig.update_layout(yaxis4_title=extra_panel)
+    
+    return fig
+
+def plot_risk_chart(risk: Dict[str, pd.DataFrame], ticker: str) -> go.Figure:
+    """Create drawdown, volatility, beta and VaR panels for one ticker."""
+    fig = make_subplots(rows=4, cols=1,
+                        shared_xaxes=True,
+                        vertical_spacing=0.05,
+                        row_heights=[0.3, 0.25, 0.2, 0.25])
+    
+    fig.add_trace(go.Scatter(
+        x=risk['Drawdown'].index,
+        y=risk['Drawdown'][ticker] * 100,
+        name='Drawdown',
+        line=dict(color='red', width=1),
+        fill='tozeroy'
+    ), row=1, col=1)
+    
+    fig.add_trace(go.Scatter(
+        x=risk['Volatility'].index,
+        y=risk['Volatility'][ticker] * 100,
+        name='Volatility',
+        line=dict(color='purple', width=1)
+    ), row=2, col=1)
+    
+    fig.add_trace(go.Scatter(
+        x=risk['Beta'].index,
+        y=risk['Beta'][ticker],
+        name=f'Beta vs {settings.RISK_BENCHMARK}',
+        line=dict(color='blue', width=1)
+    ), row=3, col=1)
+    fig.add_hline(y=1, line_dash="dash", line_color="gray", row=3, col=1)
     
+    for name, color in [('VaR (Historical)', 'orange'), ('CVaR (Historical)', 'red'),
+                        ('VaR (Parametric)', 'gray')]:
+        fig.add_trace(go.Scatter(
+            x=risk[name].index,
+            y=risk[name][ticker] * 100,
+            name=name,
+            line=dict(color=color, width=1)
+        ), row=4, col=1)
+    
+    fig.update_layout(
+        title='Risk Metrics',
+        yaxis_title='Drawdown %',
+        yaxis2_title='Volatility %',
+        yaxis3_title='Beta',
+        yaxis4_title='1-day loss %',
+        height=800
+    )
     return fig
 
-def get_technical_signals(df: pd.DataFrame) -> dict:
-    """Generate technical analysis signals."""
-    current_price = df['Close'].iloc[-1]
-    signals = {
-        "Trend Signals": {
-            "Price vs SMA20": "Bullish" if current_price > df['SMA20'].iloc[-1] else "Bearish",
-            "Price vs SMA50": "Bullish" if current_price > df['SMA50'].iloc[-1] else "Bearish",
-            "Price vs SMA200": "Bullish" if current_price > df['SMA200'].iloc[-1] else "Bearish",
-        },
-        "Momentum Signals": {
-            "RSI": "Overbought" if df['RSI'].iloc[-1] > 70 else "Oversold" if df['RSI'].iloc[-1] < 30 else "Neutral",
-            "MACD": "Bullish" if df['MACD'].iloc[-1] > df['Signal_Line'].iloc[-1] else "Bearish",
-        },
-        "Volatility Signals": {
-            "Bollinger Bands": "Upper Band" if current_price > df['BB_upper'].iloc[-1] else 
-                             "Lower Band" if current_price < df['BB_lower'].iloc[-1] else "Middle Band",
-        }
+def render_risk(ticker: str) -> None:
+    """Render rolling risk metrics from the daily history."""
+    risk = loaders.load_risk([ticker])
+    
+    st.subheader("Risk Metrics")
+    if not risk or risk['Volatility'][ticker].notna().sum() == 0:
+        st.info(f"Not enough price history to compute risk metrics for {ticker}.")
+        return
+    
+    st.caption(
+        f"Daily returns vs {settings.RISK_BENCHMARK}, {settings.RISK_WINDOW}-day window, "
+        f"{settings.RISK_VAR_LEVEL:.0%} VaR level"
+    )
+    latest = {name: frame[ticker].dropna() for name, frame in risk.items()}
+    metrics = {
+        'Beta': f"{latest['Beta'].iloc[-1]:.2f}" if len(latest['Beta']) else "-",
+        'Volatility': f"{latest['Volatility'].iloc[-1] * 100:.1f}%",
+        'VaR (1-day)': f"{latest['VaR (Historical)'].iloc[-1] * 100:.2f}%",
+        'CVaR (1-day)': f"{latest['CVaR (Historical)'].iloc[-1] * 100:.2f}%",
+        'Drawdown': f"{latest['Drawdown'].iloc[-1] * 100:.1f}%",
+        'Max Drawdown': f"{latest['Max Drawdown'].iloc[-1] * 100:.1f}%",
     }
-    return signals
+    cols = st.columns(len(metrics))
+    for col, (name, value) in zip(cols, metrics.items()):
+        col.metric(name, value)
+    
+    st.plotly_chart(plot_risk_chart(risk, ticker), use_container_width=True)
 
 def render_analysis(ticker: str) -> None:
     """Render technical analysis for a stock."""
     st.header(f"Technical Analysis for {ticker}")
     
     try:
-        # Get historical data
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period="1y")
+        timeframes = list(settings.TIMEFRAMES)
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            timeframe = st.radio(
+                "Timeframe",
+                timeframes,
+                index=timeframes.index(settings.DEFAULT_TIMEFRAME) if settings.DEFAULT_TIMEFRAME in timeframes else 0,
+                horizontal=True,
+            )
+        with col2:
+            extra_panel = st.selectbox("Lower panel", EXTRA_PANELS)
         
-        if len(hist) == 0:
+        # Get historical data with technical indicators and signals
+        df, signals = loaders.load_timeframe(ticker, timeframe)
+        
+        if len(df) == 0:
             st.warning(f"No historical data found for {ticker}")
             return
         
-        # Calculate technical indicators
-        df = calculate_technical_indicators(hist)
+        age = market.data_age("history", market.history_key(ticker))
+        st.caption(f"Price data updated {market.format_age(age)}")
         
-        # Plot technical chart
-        fig = plot_technical_chart(df)
+        # Plot technical chart; daily bars are limited to the most recent DAILY_CHART_DAYS
+        chart_df = df
+        if settings.TIMEFRAMES[timeframe] == "D":
+            chart_df = df[df.index >= df.index[-1] - pd.Timedelta(days=settings.DAILY_CHART_DAYS)]
+        fig = plot_technical_chart(chart_df, extra_panel)
         st.plotly_chart(fig, use_container_width=True)
         
         # Display technical signals
-        signals = get_technical_signals(df)
         
         st.subheader("Technical Signals")
         for category, category_signals in signals.items():
@@ -193,6 +277,8 @@ def render_analysis(ticker: str) -> None:
         with col3:
             st.metric("Resistance (BB Upper)", f"${df['BB_upper'].iloc[-1]:.2f}")
         
+        render_risk(ticker)
+        
     except Exception as e:
         st.error(f"Error analyzing technicals for {ticker}: {str(e)}")
         st.info("Please try again or choose a different stock.")
\ No newline at end of file
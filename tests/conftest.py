@@ -0,0 +1,5 @@
+"""Shared pytest configuration."""
+import os
+
+# Settings require an API key at import time; tests never call the model.
+os.environ.setdefault("OPENAI_API_KEY", "test")
@@ -0,0 +1,126 @@
+"""Tests for alert rule compilation and evaluation."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_research.alerts.engine import AlertEngine
+from stock_research.alerts.rules import AlertRule, CompiledRules, RuleSyntaxError, _parse
+
+TICKERS = ["AAPL", "MSFT", "TSLA"]
+
+
+def compile_rules(*conditions, tickers=None):
+    rules = [AlertRule(name=f"rule {i}", condition=c, tickers=tickers) for i, c in enumerate(conditions)]
+    return CompiledRules(rules, TICKERS)
+
+
+def evaluate(compiled, current, previous=None, signals=None):
+    """Evaluate every ticker given per-ticker dicts of field values and signal labels."""
+    def matrix(rows):
+        return np.array([[row.get(field, np.nan) for field in compiled.fields] for row in rows], dtype=float)
+
+    previous = previous or current
+    labels = np.empty((len(current), len(compiled.signal_names)), dtype=object)
+    for i, row in enumerate(signals or [{}] * len(current)):
+        labels[i] = [row.get(name) for name in compiled.signal_names]
+    return compiled.evaluate(np.arange(len(current)), matrix(current), matrix(previous), labels)
+
+
+@pytest.mark.parametrize("condition, expected", [
+    ("RSI > 70", ("RSI", ">", "70")),
+    ("  Close<=SMA200 ", None),
+    ("Close <= SMA200", ("Close", "<=", "SMA200")),
+    ("SMA50 crosses_above SMA200", ("SMA50", "crosses_above", "SMA200")),
+    ("Price vs SMA200 == Bearish", ("Price vs SMA200", "==", "Bearish")),
+    ("Bollinger Bands != Middle Band", ("Bollinger Bands", "!=", "Middle Band")),
+])
+def test_parse(condition, expected):
+    if expected is None:
+        with pytest.raises(RuleSyntaxError):
+            _parse(condition)
+    else:
+        assert _parse(condition) == expected
+
+
+@pytest.mark.parametrize("condition", [
+    "RSI >",
+    "SMA_200 > 100",
+    "Close crosses_above SMA_50",
+    "Price vs SMA_200 == Bearish",
+    "RSI > seventy",
+])
+def test_unknown_names_are_rejected(condition):
+    with pytest.raises(RuleSyntaxError):
+        compile_rules(condition)
+
+
+def test_custom_known_fields():
+    rules = [AlertRule(name="custom", condition="Score > 1")]
+    compiled = CompiledRules(rules, TICKERS, known_fields=["Score"])
+    assert compiled.fields == ["Score"]
+
+
+def test_threshold_and_pair_rules():
+    compiled = compile_rules("RSI > 70", "RSI <= 30", "Close < SMA200")
+    hits = evaluate(compiled, [
+        {"RSI": 75, "Close": 90, "SMA200": 100},
+        {"RSI": 30, "Close": 110, "SMA200": 100},
+        {"RSI": np.nan, "Close": np.nan, "SMA200": 100},
+    ])
+    np.testing.assert_array_equal(hits, [
+        [True, False, True],
+        [False, True, False],
+        [False, False, False],
+    ])
+
+
+def test_crossings_fire_only_on_the_flip():
+    compiled = compile_rules("RSI crosses_above 70", "SMA50 crosses_below SMA200")
+    previous = [
+        {"RSI": 65, "SMA50": 101, "SMA200": 100},
+        {"RSI": 72, "SMA50": 100, "SMA200": 100},
+        {"RSI": np.nan, "SMA50": np.nan, "SMA200": 100},
+    ]
+    current = [
+        {"RSI": 71, "SMA50": 99, "SMA200": 100},
+        {"RSI": 75, "SMA50": 99, "SMA200": 100},
+        {"RSI": 80, "SMA50": 99, "SMA200": 100},
+    ]
+    np.testing.assert_array_equal(evaluate(compiled, current, previous), [
+        [True, True],
+        [False, True],
+        [False, False],
+    ])
+
+
+def test_signal_rules_and_ticker_scope():
+    compiled = compile_rules("Price vs SMA200 == Bearish", tickers=["msft", "TSLA"])
+    hits = evaluate(compiled, [{}, {}, {}], signals=[
+        {"Price vs SMA200": "Bearish"},
+        {"Price vs SMA200": "Bearish"},
+        {"Price vs SMA200": "N/A"},
+    ])
+    np.testing.assert_array_equal(hits, [[False], [True], [False]])
+
+
+def frame(closes):
+    index = pd.bdate_range("2024-01-01", periods=len(closes))
+    return pd.DataFrame({"Close": closes, "SMA200": 100.0}, index=index)
+
+
+def test_engine_level_rules_fire_on_entry_only():
+    engine = AlertEngine([AlertRule(name="above", condition="Close > SMA200")], ["AAPL"])
+
+    fired = [
+        len(engine.evaluate({"AAPL": engine.snapshot(frame(closes), {})}))
+        for closes in ([90, 95], [95, 105], [105, 110], [110, 95], [95, 101])
+    ]
+    assert fired == [0, 1, 0, 0, 1]
+
+
+def test_engine_skips_unchanged_tickers():
+    engine = AlertEngine([AlertRule(name="above", condition="Close > SMA200")], ["AAPL"])
+    snapshot = engine.snapshot(frame([95, 105]), {})
+
+    assert len(engine.evaluate({"AAPL": snapshot})) == 1
+    assert engine.evaluate({"AAPL": snapshot}) == []
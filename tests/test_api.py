@@ -0,0 +1,88 @@
+"""Tests for the analysis API error handling and request coalescing."""
+import asyncio
+import threading
+
+import pytest
+
+from stock_research.api import app as api
+
+
+@pytest.fixture
+def analyses(monkeypatch):
+    """Replace the analyses with test doubles."""
+    replaced = {}
+    monkeypatch.setattr(api, "ANALYSES", replaced)
+    return replaced
+
+
+def test_not_found_maps_to_404(analyses):
+    def missing(ticker, params):
+        raise api.AnalysisNotFound(f"No historical data found for {ticker}")
+
+    analyses["technical"] = missing
+    with pytest.raises(api.HTTPError) as excinfo:
+        asyncio.run(api.AnalysisAPI()._payload("technical", "AAPL", {}))
+    assert excinfo.value.status == 404
+
+
+def test_internal_key_error_maps_to_502(analyses):
+    def broken(ticker, params):
+        return {}["Close"]
+
+    analyses["technical"] = broken
+    with pytest.raises(api.HTTPError) as excinfo:
+        asyncio.run(api.AnalysisAPI()._payload("technical", "AAPL", {}))
+    assert excinfo.value.status == 502
+
+
+def test_waiters_recover_when_the_leader_is_cancelled(analyses):
+    release = threading.Event()
+    calls = []
+
+    def slow(ticker, params):
+        calls.append(ticker)
+        release.wait(5)
+        return {"ticker": ticker}
+
+    analyses["technical"] = slow
+
+    async def scenario():
+        service = api.AnalysisAPI()
+        leader = asyncio.create_task(service._payload("technical", "AAPL", {}))
+        await asyncio.sleep(0.05)
+        waiter = asyncio.create_task(service._payload("technical", "AAPL", {}))
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        await asyncio.sleep(0.05)
+        release.set()
+        payload, _, _ = await asyncio.wait_for(waiter, timeout=5)
+        return leader, payload
+
+    leader, payload = asyncio.run(scenario())
+    assert leader.cancelled()
+    assert payload == {"ticker": "AAPL"}
+    assert len(calls) == 2
+
+
+def test_not_found_is_cached_briefly(analyses, monkeypatch):
+    calls = []
+
+    def missing(ticker, params):
+        calls.append(ticker)
+        raise api.AnalysisNotFound(f"No historical data found for {ticker}")
+
+    analyses["technical"] = missing
+    server = api.AnalysisAPI()
+    for _ in range(3):
+        with pytest.raises(api.HTTPError) as excinfo:
+            asyncio.run(server._payload("technical", "ZZZZ", {}))
+        assert excinfo.value.status == 404
+    assert calls == ["ZZZZ"]
+
+    # Once the entry expires the ticker is looked up again
+    monkeypatch.setattr(api.settings, "API_NOT_FOUND_TTL", -1)
+    server.cache = api.ResponseCache(api.settings.API_CACHE_TTL, api.settings.API_CACHE_SIZE)
+    for _ in range(2):
+        with pytest.raises(api.HTTPError):
+            asyncio.run(server._payload("technical", "ZZZZ", {}))
+    assert calls == ["ZZZZ"] * 3
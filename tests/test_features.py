@@ -0,0 +1,30 @@
+"""Tests for the token-budgeted feature context."""
+import logging
+
+from stock_research.ai.agents import features
+
+
+def test_failed_sections_are_logged_and_recorded(monkeypatch, caplog):
+    def broken(ticker):
+        raise RuntimeError("upstream unavailable")
+
+    monkeypatch.setattr(features, "_BUILDERS", {
+        "technical": lambda ticker: ["RSI: 55.0"],
+        "fundamental": broken,
+        "sentiment": lambda ticker: [],
+    })
+
+    with caplog.at_level(logging.WARNING, logger=features.__name__):
+        context = features.build_feature_context("AAPL", token_budget=200)
+
+    assert context.sections == ["technical"]
+    assert context.failed == ["fundamental"]
+    assert "RSI: 55.0" in context.text
+    assert any(record.exc_info for record in caplog.records)
+
+
+def test_empty_sections_are_not_failures(monkeypatch):
+    monkeypatch.setattr(features, "_BUILDERS", {name: (lambda ticker: []) for name in features.SECTIONS})
+    context = features.build_feature_context("AAPL")
+    assert context.sections == []
+    assert context.failed == []
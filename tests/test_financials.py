@@ -0,0 +1,62 @@
+"""Tests for statement merging and TTM ratios."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_research.analysis.financials import compute_ttm_ratios
+from stock_research.data.market import _merge_periods
+
+QUARTER_ENDS = [
+    "2022-03-31", "2022-06-30", "2022-09-30", "2022-12-31",
+    "2023-03-31", "2023-06-30", "2023-09-30", "2023-12-31",
+]
+
+
+def income(revenue, net_income, periods=QUARTER_ENDS):
+    return pd.DataFrame(
+        {"Total Revenue": revenue, "Net Income": net_income},
+        index=pd.to_datetime(periods),
+    )
+
+
+def test_merge_extends_the_stored_history_and_fetched_values_win():
+    stored = income([100.0, 101.0, 102.0, 103.0], [10.0] * 4, QUARTER_ENDS[:4])
+    # Yahoo returns line items x periods, newest first; the 2022-12-31 quarter was restated
+    fetched = income([99.0, 104.0, 105.0], [11.0] * 3, QUARTER_ENDS[3:6]).iloc[::-1].T
+
+    merged = _merge_periods(stored, fetched)
+
+    assert list(merged.index) == list(pd.to_datetime(QUARTER_ENDS[:6]))
+    assert list(merged["Total Revenue"]) == [100.0, 101.0, 102.0, 99.0, 104.0, 105.0]
+    assert list(merged["Net Income"]) == [10.0, 10.0, 10.0, 11.0, 11.0, 11.0]
+
+
+def test_merge_keeps_the_stored_history_when_nothing_is_fetched():
+    stored = income([100.0, 101.0], [10.0, 10.0], QUARTER_ENDS[:2])
+    pd.testing.assert_frame_equal(_merge_periods(stored, pd.DataFrame()), stored)
+    pd.testing.assert_frame_equal(_merge_periods(stored, None), stored)
+
+
+def test_ttm_is_nan_across_a_missing_quarter():
+    # 2022-12-31 is missing from the stored history
+    periods = QUARTER_ENDS[:3] + QUARTER_ENDS[4:]
+    ratios = compute_ttm_ratios({"income": income([100.0] * 7, [10.0] * 7, periods)})
+    ttm = ratios["Revenue (TTM)"]
+
+    # Every four-row window up to 2023-09-30 spans the gap
+    assert ttm.loc[:"2023-09-30"].isna().all()
+    assert ttm.loc["2023-12-31"] == pytest.approx(400.0)
+    assert ratios["Net Margin"].loc["2023-12-31"] == pytest.approx(0.1)
+
+
+def test_yoy_growth_on_a_known_series():
+    ratios = compute_ttm_ratios({
+        "income": income([100.0] * 4 + [110.0] * 4, [-10.0] * 4 + [10.0] * 4),
+    })
+
+    revenue_growth = ratios["Revenue Growth (YoY)"]
+    assert revenue_growth.iloc[:7].isna().all()
+    assert revenue_growth.iloc[7] == pytest.approx(0.1)
+    # From a TTM loss of 40 to a TTM profit of 40, relative to the size of the loss
+    assert ratios["Net Income Growth (YoY)"].iloc[7] == pytest.approx(2.0)
+    assert np.isnan(ratios["ROE"]).all()
@@ -0,0 +1,102 @@
+"""Tests for the NumPy indicator kernels against straightforward pandas references.
+
+The benchmark in ``benchmarks/bench_indicators.py`` reuses these references.
+"""
+import numpy as np
+import pandas as pd
+
+from stock_research.analysis import indicators
+
+
+def reference(df: pd.DataFrame, n: int = 14) -> dict:
+    """Straightforward pandas implementations of each indicator."""
+    high, low, close, volume = df["High"], df["Low"], df["Close"], df["Volume"]
+    wilder = dict(alpha=1 / n, adjust=False)
+
+    prev_close = close.shift()
+    tr = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
+    atr = tr.ewm(**wilder).mean()
+
+    up, down = high.diff(), -low.diff()
+    plus_dm = up.where((up > down) & (up > 0), 0.0)
+    minus_dm = down.where((down > up) & (down > 0), 0.0)
+    plus_di = 100 * plus_dm.ewm(**wilder).mean() / atr
+    minus_di = 100 * minus_dm.ewm(**wilder).mean() / atr
+    dx = (100 * (plus_di - minus_di).abs() / (plus_di + minus_di)).fillna(0.0)
+    adx = dx.ewm(**wilder).mean()
+
+    lowest, highest = low.rolling(n).min(), high.rolling(n).max()
+    stoch_k = (100 * (close - lowest) / (highest - lowest)).where(highest > lowest, 50.0)
+    stoch_k = stoch_k.where(highest.notna())
+    stoch_d = stoch_k.rolling(3).mean()
+
+    obv = (np.sign(close.diff()).fillna(0) * volume).cumsum()
+
+    typical = (high + low + close) / 3
+    vwap = (typical * volume).cumsum() / volume.cumsum()
+    vwap_20 = (typical * volume).rolling(20).sum() / volume.rolling(20).sum()
+
+    return {
+        "atr": atr, "adx": adx, "plus_di": plus_di, "minus_di": minus_di,
+        "stoch_k": stoch_k, "stoch_d": stoch_d, "obv": obv, "vwap": vwap, "vwap_20": vwap_20,
+    }
+
+
+def kernels(high, low, close, volume, n: int = 14) -> dict:
+    """The NumPy kernels under test."""
+    adx, plus_di, minus_di = indicators.adx(high, low, close, n)
+    stoch_k, stoch_d = indicators.stochastic(high, low, close, n, 3)
+    return {
+        "atr": indicators.atr(high, low, close, n),
+        "adx": adx, "plus_di": plus_di, "minus_di": minus_di,
+        "stoch_k": stoch_k, "stoch_d": stoch_d,
+        "obv": indicators.obv(close, volume),
+        "vwap": indicators.vwap(high, low, close, volume),
+        "vwap_20": indicators.vwap(high, low, close, volume, window=20),
+    }
+
+
+def random_ohlcv(bars: int, tickers: int, seed: int = 0) -> dict:
+    """Random-walk OHLCV panels with staggered listing dates."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (bars, tickers)), axis=0))
+    spread = np.abs(rng.normal(0, 0.01, (bars, tickers))) * close
+    panel = {
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+        "Volume": rng.integers(1_000, 1_000_000, (bars, tickers)).astype(float),
+    }
+    listed = rng.integers(0, bars // 4, tickers)
+    for values in panel.values():
+        values[np.arange(bars)[:, None] < listed] = np.nan
+    return panel
+
+
+def check(panel: dict, columns: int = 20) -> float:
+    """Return the largest absolute difference from the pandas references."""
+    got = kernels(panel["High"], panel["Low"], panel["Close"], panel["Volume"])
+    worst = 0.0
+    for col in range(min(columns, panel["Close"].shape[1])):
+        df = pd.DataFrame({name: values[:, col] for name, values in panel.items()}).dropna()
+        expected = reference(df)
+        for name, series in expected.items():
+            actual = got[name][df.index.to_numpy(), col]
+            np.testing.assert_allclose(actual, series.to_numpy(), rtol=1e-8, atol=1e-8, err_msg=name)
+            both = ~np.isnan(actual)
+            if both.any():
+                worst = max(worst, float(np.max(np.abs(actual[both] - series.to_numpy()[both]))))
+    return worst
+
+
+def test_kernels_match_pandas_on_a_panel_with_staggered_listings():
+    panel = random_ohlcv(bars=300, tickers=8)
+    assert check(panel, columns=8) < 1e-8
+
+
+def test_single_series_matches_a_panel_column():
+    panel = random_ohlcv(bars=200, tickers=3, seed=1)
+    on_panel = kernels(panel["High"], panel["Low"], panel["Close"], panel["Volume"])
+    single = kernels(*(panel[name][:, 2] for name in ("High", "Low", "Close", "Volume")))
+    for name, values in single.items():
+        np.testing.assert_array_equal(values, on_panel[name][:, 2], err_msg=name)
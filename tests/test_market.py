@@ -0,0 +1,124 @@
+"""Tests for hedged fetches in the market data layer."""
+import threading
+import time
+
+import pytest
+
+from stock_research.data import market
+from stock_research.data.ratelimit import BATCH, HostRateLimiter
+
+
+class MemoryCache:
+    def __init__(self):
+        self.entries = {}
+
+    def get_entry(self, kind, key):
+        return self.entries.get((kind, key))
+
+    def set(self, kind, key, value):
+        self.entries[(kind, key)] = (value, time.time())
+
+
+class CountingTicker:
+    """Stands in for ``yf.Ticker``, counting upstream calls to ``.info``."""
+
+    calls = []
+    delay = 0.0
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+
+    @property
+    def info(self):
+        CountingTicker.calls.append(self.ticker)
+        time.sleep(CountingTicker.delay)
+        return {"symbol": self.ticker}
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    """Count upstream calls behind a fresh limiter and cache, hedging after 0.2s."""
+    CountingTicker.calls = []
+    CountingTicker.delay = 0.0
+    monkeypatch.setattr(market.yf, "Ticker", CountingTicker)
+    monkeypatch.setattr(market, "cache", MemoryCache())
+    monkeypatch.setattr(market.settings, "HEDGE_AFTER", 0.2)
+
+    def limiter(rate, burst):
+        replacement = HostRateLimiter(db_path=tmp_path / "rl.sqlite3", limits={"yahoo": (rate, burst)})
+        monkeypatch.setattr(market, "rate_limiter", replacement)
+        return replacement
+
+    return limiter
+
+
+def test_request_queued_in_the_limiter_is_not_hedged(upstream):
+    limiter = upstream(2.0, 1)
+    limiter.acquire("yahoo")
+
+    start = time.monotonic()
+    assert market.get_info("AAPL") == {"symbol": "AAPL"}
+    # Waited about 0.5s for a token, longer than HEDGE_AFTER, but sent one request
+    assert time.monotonic() - start >= 0.4
+    time.sleep(0.8)  # A duplicate queued behind the limiter would have been sent by now
+    assert CountingTicker.calls == ["AAPL"]
+    assert limiter.get_metrics()["yahoo/interactive"]["requests"] == 2
+
+
+def test_slow_request_is_hedged_when_a_token_is_free(upstream):
+    upstream(100.0, 5)
+    CountingTicker.delay = 0.5
+
+    market.get_info("AAPL")
+    assert CountingTicker.calls == ["AAPL", "AAPL"]
+
+
+def test_slow_request_is_not_hedged_without_a_free_token(upstream):
+    limiter = upstream(0.5, 1)
+    CountingTicker.delay = 0.5
+
+    market.get_info("AAPL")
+    assert CountingTicker.calls == ["AAPL"]
+    assert limiter.get_metrics()["yahoo/interactive"]["timeouts"] == 0
+
+
+def test_batch_requests_are_not_hedged(upstream):
+    upstream(100.0, 5)
+    CountingTicker.delay = 0.5
+
+    market.get_info("AAPL", priority=BATCH)
+    assert CountingTicker.calls == ["AAPL"]
+
+
+def test_request_queued_for_a_fetch_worker_is_not_hedged(upstream, monkeypatch):
+    upstream(100.0, 5)
+    monkeypatch.setattr(market, "_fetch_slots", threading.BoundedSemaphore(1))
+    market._fetch_slots.acquire()
+    threading.Timer(0.4, market._fetch_slots.release).start()
+
+    market.get_info("AAPL")
+    assert CountingTicker.calls == ["AAPL"]
+
+
+def test_stocktwits_is_cached_and_time_limited(upstream, monkeypatch):
+    upstream(100.0, 5)
+    calls = []
+
+    class Response:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"messages": [{"body": "to the moon", "entities": {"sentiment": {"basic": "Bullish"}}}]}
+
+    def get(url, timeout):
+        calls.append((url, timeout))
+        return Response()
+
+    monkeypatch.setattr(market.requests, "get", get)
+    for _ in range(3):
+        messages = market.get_stocktwits("AAPL")
+
+    assert messages[0]["body"] == "to the moon"
+    assert calls == [(market.STOCKTWITS_URL.format(symbol="AAPL"), market.settings.REQUEST_TIMEOUT)]
+    assert market.fetched_at("stocktwits", "AAPL") is not None
@@ -0,0 +1,123 @@
+"""Tests for option pricing, implied volatility and chain loading."""
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_research.analysis.options import bs_price, greeks, implied_volatility
+from stock_research.data import loaders, market
+
+
+class FakeTicker:
+    options = ["2030-01-18"]
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+
+    def option_chain(self, expiry):
+        contracts = pd.DataFrame({
+            "contractSymbol": ["C95", "C105"],
+            "strike": [95.0, 105.0],
+            "lastPrice": [12.0, 5.0],
+            "bid": [11.9, 4.9],
+            "ask": [12.1, 5.1],
+            "volume": [10, 20],
+            "openInterest": [100, 200],
+            "impliedVolatility": [0.2, 0.2],
+        })
+        return SimpleNamespace(calls=contracts, puts=None, underlying={"regularMarketPrice": 101.5})
+
+
+class MemoryCache:
+    def __init__(self):
+        self.entries = {}
+
+    def get_entry(self, kind, key):
+        return self.entries.get((kind, key))
+
+    def set(self, kind, key, value):
+        self.entries[(kind, key)] = (value, 0.0)
+
+
+@pytest.fixture
+def chains(monkeypatch):
+    """Fetch chains from ``FakeTicker`` without caching or rate limiting."""
+    monkeypatch.setattr(market.yf, "Ticker", FakeTicker)
+    monkeypatch.setattr(market.rate_limiter, "acquire", lambda *args, **kwargs: None)
+    monkeypatch.setattr(market, "_serve", lambda kind, key, fetch, priority, refresh, **kwargs: fetch(priority))
+    monkeypatch.setattr(market, "fetched_at", lambda kind, key: 1_700_000_000.0)
+    monkeypatch.setattr(loaders, "cache", MemoryCache())
+
+
+def test_chain_carries_the_underlying_quote(chains):
+    chain = market.get_option_chains("AAPL")
+    assert list(chain["underlyingPrice"]) == [101.5, 101.5]
+
+
+def test_spot_comes_from_the_chain_not_the_history(chains, monkeypatch):
+    def stale_history(*args, **kwargs):
+        raise AssertionError("spot must not come from the daily history")
+
+    monkeypatch.setattr(market, "get_history", stale_history)
+    solved, spot = loaders.load_options("AAPL")
+
+    assert spot == 101.5
+    assert list(solved["moneyness"]) == pytest.approx([95 / 101.5, 105 / 101.5])
+
+
+def test_missing_underlying_quote_gives_no_spot(chains, monkeypatch):
+    chain = market.get_option_chains("AAPL").assign(underlyingPrice=float("nan"))
+    monkeypatch.setattr(market, "get_option_chains", lambda *args, **kwargs: chain)
+
+    solved, spot = loaders.load_options("AAPL")
+    assert spot is None
+    assert "iv" not in solved
+
+
+def test_implied_volatility_round_trip():
+    rng = np.random.default_rng(0)
+    n = 2000
+    spot = 100.0
+    strike = spot * rng.uniform(0.7, 1.3, n)
+    t = rng.uniform(7, 730, n) / 365
+    sigma = rng.uniform(0.1, 1.0, n)
+    is_call = rng.random(n) < 0.5
+    price = bs_price(spot, strike, t, 0.04, 0.01, sigma, is_call)
+
+    solved = implied_volatility(price, spot, strike, t, 0.04, 0.01, is_call)
+
+    # Volatility is identifiable only where the price is sensitive to it
+    vega = greeks(spot, strike, t, 0.04, 0.01, sigma, is_call)["vega"]
+    identifiable = vega > 1e-3
+    assert identifiable.mean() > 0.9
+    np.testing.assert_allclose(solved[identifiable], sigma[identifiable], atol=1e-5)
+
+
+def test_implied_volatility_rejects_unsolvable_inputs():
+    spot, strike, t = 100.0, 90.0, 0.5
+    intrinsic = spot - strike * np.exp(-0.04 * t)
+    prices = np.array([intrinsic - 1.0, spot + 1.0, 5.0, 5.0, 5.0])
+    times = np.array([t, t, 0.0, -0.1, t])
+    is_call = np.array([True, True, True, True, False])
+
+    solved = implied_volatility(prices, spot, strike, times, 0.04, 0.0, is_call)
+
+    # Below intrinsic, above the spot, expired and negative time give NaN
+    assert np.isnan(solved[:4]).all()
+    assert np.isfinite(solved[4])
+
+
+def test_greeks_match_finite_differences():
+    args = dict(strike=105.0, t=0.5, rate=0.04, div=0.01, is_call=True)
+    sigma, spot, h = 0.3, 100.0, 1e-3
+    g = greeks(spot, sigma=sigma, **args)
+
+    def price(s=spot, vol=sigma):
+        return bs_price(s, sigma=vol, **args)
+
+    assert g["delta"] == pytest.approx((price(spot + h) - price(spot - h)) / (2 * h), rel=1e-4)
+    # A wider step for the second difference keeps the CDF approximation error out of it
+    step = 0.5
+    assert g["gamma"] == pytest.approx((price(spot + step) - 2 * price() + price(spot - step)) / step ** 2, rel=1e-3)
+    assert g["vega"] == pytest.approx((price(vol=sigma + h) - price(vol=sigma - h)) / (2 * h) / 100, rel=1e-4)
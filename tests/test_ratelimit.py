@@ -0,0 +1,80 @@
+"""Tests for the host-wide rate limiter."""
+import threading
+import time
+
+import pytest
+
+from stock_research.data.ratelimit import BATCH, INTERACTIVE, HostRateLimiter, RateLimitTimeout
+
+
+def test_metrics_are_shared_through_the_database(tmp_path):
+    db = tmp_path / "ratelimit.sqlite3"
+    first = HostRateLimiter(db_path=db, limits={"yahoo": (100.0, 5)}, batch_reserve=0.0)
+    second = HostRateLimiter(db_path=db, limits={"yahoo": (100.0, 5)}, batch_reserve=0.0)
+
+    first.acquire("yahoo", INTERACTIVE)
+    second.acquire("yahoo", INTERACTIVE)
+    second.acquire("yahoo", BATCH)
+
+    metrics = first.get_metrics()
+    assert metrics["yahoo/interactive"]["requests"] == 2
+    assert metrics["yahoo/batch"]["requests"] == 1
+    assert metrics == second.get_metrics()
+
+
+def test_timeouts_are_counted(tmp_path):
+    limiter = HostRateLimiter(db_path=tmp_path / "rl.sqlite3", limits={"yahoo": (0.01, 1)})
+    limiter.acquire("yahoo")
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire("yahoo", timeout=0.1)
+
+    metrics = limiter.get_metrics()["yahoo/interactive"]
+    assert metrics["requests"] == 2
+    assert metrics["timeouts"] == 1
+
+
+def test_unlimited_hosts_are_not_recorded(tmp_path):
+    limiter = HostRateLimiter(db_path=tmp_path / "rl.sqlite3", limits={})
+    assert limiter.acquire("example.com") == 0.0
+    assert limiter.get_metrics() == {}
+
+
+def test_tokens_are_paced_at_the_configured_rate(tmp_path):
+    limiter = HostRateLimiter(db_path=tmp_path / "rl.sqlite3", limits={"yahoo": (20.0, 1)})
+
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire("yahoo", timeout=5.0)
+    # The first token comes from the full bucket, the other four at 20 per second
+    assert time.monotonic() - start >= 0.18
+
+
+def test_batch_can_use_a_bucket_smaller_than_its_reserve(tmp_path):
+    limiter = HostRateLimiter(db_path=tmp_path / "rl.sqlite3", limits={"yahoo": (5.0, 1)}, batch_reserve=0.5)
+
+    for _ in range(3):
+        limiter.acquire("yahoo", BATCH, timeout=2.0)
+    assert limiter.get_metrics()["yahoo/batch"]["timeouts"] == 0
+
+
+def test_batch_yields_to_a_waiting_interactive_caller(tmp_path):
+    db = tmp_path / "rl.sqlite3"
+    limits = {"yahoo": (2.0, 2)}
+    limiter = HostRateLimiter(db_path=db, limits=limits, batch_reserve=0.0)
+    limiter.acquire("yahoo")
+    limiter.acquire("yahoo")
+
+    order = []
+    interactive = threading.Thread(
+        target=lambda: (HostRateLimiter(db_path=db, limits=limits).acquire("yahoo", timeout=5.0),
+                        order.append("interactive"))
+    )
+    interactive.start()
+    time.sleep(0.05)  # Let the interactive caller register as a waiter
+
+    # The interactive caller gets the token due at 0.5s, the batch caller the one at 1s
+    limiter.acquire("yahoo", BATCH, timeout=1.3)
+    order.append("batch")
+    interactive.join()
+
+    assert order == ["interactive", "batch"]
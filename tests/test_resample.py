@@ -0,0 +1,67 @@
+"""Tests for multi-timeframe resampling."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_research.analysis.resample import resample_ohlcv, update_resampled
+
+
+def daily_bars(bars: int, seed: int = 0) -> pd.DataFrame:
+    """Random-walk daily OHLCV on business days."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2023-01-02", periods=bars, tz="America/New_York")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+    open_ = close * (1 + rng.normal(0, 0.005, bars))
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) * 1.01,
+        "Low": np.minimum(open_, close) * 0.99,
+        "Close": close,
+        "Volume": rng.integers(1_000, 10_000, bars).astype(float),
+    }, index=index)
+
+
+def assert_same_bars(result, expected):
+    pd.testing.assert_frame_equal(result.frame, expected.frame)
+    np.testing.assert_array_equal(result.codes, expected.codes)
+
+
+@pytest.mark.parametrize("rule", ["W", "M", "Q", "3D", "10D"])
+def test_incremental_update_matches_full_resample(rule):
+    daily = daily_bars(300)
+    previous = resample_ohlcv(daily.iloc[:290], rule)
+
+    # New bars arrive and the oldest ones roll out of the window
+    current = daily.iloc[7:]
+    assert_same_bars(update_resampled(previous, current, rule), resample_ohlcv(current, rule))
+
+
+@pytest.mark.parametrize("rule", ["W", "M"])
+def test_split_adjustment_triggers_full_resample(rule):
+    daily = daily_bars(300)
+    previous = resample_ohlcv(daily.iloc[:295], rule)
+
+    # A 4:1 split on the last bar rewrites every earlier adjusted price and volume
+    adjusted = daily.copy()
+    adjusted.iloc[:-1, :4] /= 4
+    adjusted.iloc[:-1, 4] *= 4
+
+    result = update_resampled(previous, adjusted, rule)
+    assert_same_bars(result, resample_ohlcv(adjusted, rule))
+
+
+def test_dividend_adjustment_triggers_full_resample():
+    daily = daily_bars(300)
+    previous = resample_ohlcv(daily.iloc[:295], "W")
+
+    adjusted = daily.copy()
+    adjusted.iloc[:-3, :4] *= 0.995
+
+    assert_same_bars(update_resampled(previous, adjusted, "W"), resample_ohlcv(adjusted, "W"))
+
+
+def test_previous_without_closes_is_rebuilt():
+    daily = daily_bars(120)
+    full = resample_ohlcv(daily, "W")
+    legacy = full._replace(closes=None)
+    assert_same_bars(update_resampled(legacy, daily, "W"), full)
@@ -0,0 +1,46 @@
+"""Tests for rolling risk metrics."""
+import numpy as np
+import pandas as pd
+
+from stock_research.analysis.risk import RISK_METRICS, compute_risk
+
+WINDOW = 20
+
+
+def prices(index: pd.DatetimeIndex, seed: int) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index)))), index=index)
+
+
+def test_tickers_on_different_calendars_get_metrics_on_their_own_dates():
+    days = pd.bdate_range("2024-01-01", periods=200)
+    us = prices(days, 1)
+    # Another exchange closed on different days than the benchmark
+    foreign = prices(days, 2).drop(days[5::9])
+    benchmark = prices(days, 3).drop(days[7::11])
+    closes = pd.DataFrame({"US": us, "FOREIGN": foreign})
+
+    risk = compute_risk(closes, benchmark, window=WINDOW)
+
+    for name in RISK_METRICS:
+        traded = risk[name]["FOREIGN"].reindex(foreign.index)
+        assert traded.iloc[WINDOW + 1:].notna().all(), name
+        assert risk[name]["FOREIGN"].drop(foreign.index).isna().all(), name
+
+    # Alone, each ticker gives the same numbers as in the mixed panel
+    alone = compute_risk(foreign.to_frame("FOREIGN"), benchmark, window=WINDOW)
+    for name in RISK_METRICS:
+        pd.testing.assert_series_equal(risk[name]["FOREIGN"].dropna(), alone[name]["FOREIGN"].dropna())
+
+
+def test_beta_uses_the_benchmark_move_over_the_same_interval():
+    days = pd.bdate_range("2024-01-01", periods=120)
+    benchmark = prices(days, 4)
+    # Twice the benchmark's move on every day the ticker trades, skipping every fifth day
+    traded = days.delete(np.s_[3::5])
+    bench_moves = benchmark.reindex(traded).pct_change().fillna(0)
+    ticker = 50 * (1 + 2 * bench_moves).cumprod()
+
+    beta = compute_risk(ticker.to_frame("T"), benchmark, window=WINDOW)["Beta"]["T"].dropna()
+    assert len(beta) > 0
+    np.testing.assert_allclose(beta, 2.0)
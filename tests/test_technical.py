@@ -0,0 +1,45 @@
+"""Tests for technical signals."""
+import numpy as np
+import pandas as pd
+
+from stock_research.analysis.technical import (
+    NOT_AVAILABLE,
+    calculate_technical_indicators,
+    get_technical_signals,
+)
+
+
+def ohlcv(bars: int) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+    return pd.DataFrame({
+        "Open": close,
+        "High": close * 1.01,
+        "Low": close * 0.99,
+        "Close": close,
+        "Volume": rng.integers(1_000, 10_000, bars).astype(float),
+    }, index=pd.bdate_range("2020-01-01", periods=bars))
+
+
+def test_short_history_reports_undefined_signals_as_not_available():
+    # About five years of monthly bars: SMA200 is never defined
+    signals = get_technical_signals(calculate_technical_indicators(ohlcv(60)))
+
+    assert signals["Trend Signals"]["Price vs SMA200"] == NOT_AVAILABLE
+    assert signals["Trend Signals"]["Price vs SMA50"] != NOT_AVAILABLE
+    assert signals["Momentum Signals"]["RSI"] != NOT_AVAILABLE
+
+
+def test_very_short_history_has_no_directional_signals():
+    signals = get_technical_signals(calculate_technical_indicators(ohlcv(10)))
+
+    assert signals["Trend Signals"]["Price vs SMA20"] == NOT_AVAILABLE
+    assert signals["Volatility Signals"]["Bollinger Bands"] == NOT_AVAILABLE
+    assert signals["Volume Signals"]["OBV (20-day)"] == NOT_AVAILABLE
+
+
+def test_full_history_defines_every_signal():
+    signals = get_technical_signals(calculate_technical_indicators(ohlcv(300)))
+
+    for category_signals in signals.values():
+        assert NOT_AVAILABLE not in category_signals.values()
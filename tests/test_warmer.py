@@ -0,0 +1,42 @@
+"""Tests for usage ranking and the cache warmer schedule."""
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from stock_research.config.settings import settings
+from stock_research.data import usage, warmer
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+@pytest.fixture
+def usage_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "USAGE_DB", tmp_path / "usage.sqlite3")
+
+
+def test_rank_tickers_orders_by_recent_use(usage_db):
+    for ticker in ["msft", "AAPL", "MSFT", "TSLA", "MSFT", "AAPL"]:
+        usage.record_usage(ticker)
+
+    assert usage.rank_tickers(["NVDA", "aapl", "TSLA", "MSFT"]) == ["MSFT", "AAPL", "TSLA", "NVDA"]
+    assert usage.seconds_since_last_use() < 5
+
+
+def test_never_used_is_quiet(usage_db):
+    assert usage.seconds_since_last_use() is None
+    assert warmer.is_quiet()
+
+
+@pytest.mark.parametrize("now, idle, expected", [
+    (datetime(2024, 3, 4, 8, 0), 0, True),         # Monday pre-market, even while busy
+    (datetime(2024, 3, 4, 11, 0), 0, False),       # Session, analysts active
+    (datetime(2024, 3, 4, 11, 0), 3600, True),     # Session, quiet
+    (datetime(2024, 3, 4, 20, 0), 3600, False),    # After the close
+    (datetime(2024, 3, 5, 2, 0), None, False),     # Overnight
+    (datetime(2024, 3, 9, 11, 0), 3600, False),    # Saturday
+    (datetime(2024, 3, 9, 8, 0), None, False),     # Saturday "pre-market"
+])
+def test_schedule(monkeypatch, now, idle, expected):
+    monkeypatch.setattr(usage, "seconds_since_last_use", lambda: idle)
+    assert warmer.should_warm(now.replace(tzinfo=NEW_YORK)) is expected